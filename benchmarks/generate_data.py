@@ -0,0 +1,83 @@
+import argparse
+import os
+from datetime import datetime
+import numpy
+import pandas
+
+# names of the first columns like in the OELEK measurements; more columns are called "ch<n> /V"
+BASE_COLUMNS = ["time /s", "I /A", "E /V"]
+HH_MM_SS_COLUMN = "Uhrzeit"
+
+
+def file_name(rows, columns, hh_mm_ss=False, start=datetime(2025, 1, 22, 12, 30)):
+    # yymmdd_hhmm_xyz like described in README.md
+    suffix = "_hms" if hh_mm_ss else ""
+    return f"{start:%y%m%d_%H%M}_bench_{rows}x{columns}{suffix}.csv"
+
+
+def column_names(columns):
+    names = BASE_COLUMNS[:columns]
+    names += [f"ch{i} /V" for i in range(columns - len(names))]
+    return names
+
+
+def generate_chunk(rng, start_row, rows, columns, start_time):
+    # irregular time steps around 1 s with jitter and some gaps
+    dt = rng.gamma(20, 0.05, rows)
+    dt[rng.random(rows) < 0.001] *= 50
+    time = start_time + numpy.cumsum(dt)
+
+    # constant current phases (0 -> 2 -> 1 -> -1 -> -2 ...) with length of about 1000 rows
+    phase = (numpy.arange(start_row, start_row + rows) // 1000) % 5
+    current = numpy.array([0, 2, 1, -1, -2], dtype=float)[phase] + rng.normal(0, 0.002, rows)
+
+    # voltage follows current with some noise and ripple
+    voltage = 3.6 + 0.05 * current + 0.01 * numpy.sin(time / 5) + rng.normal(0, 0.001, rows)
+
+    data = {"time /s": time, "I /A": current, "E /V": voltage}
+    names = column_names(columns)
+    for name in names[len(BASE_COLUMNS):]:
+        data[name] = voltage + rng.normal(0, 0.01, rows)
+    return pandas.DataFrame({name: data[name] for name in names})
+
+
+def hh_mm_ss(time, start=datetime(2025, 1, 22, 12, 30)):
+    # time of day for every row as hh:mm:ss
+    seconds = (start.hour * 3600 + start.minute * 60 + time.astype(numpy.int64)) % 86400
+    hours, rest = numpy.divmod(seconds, 3600)
+    minutes, secs = numpy.divmod(rest, 60)
+    return [f"{h:02d}:{m:02d}:{s:02d}" for h, m, s in zip(hours, minutes, secs)]
+
+
+def generate_csv(path, rows, columns, hh_mm_ss_column=False, chunk_rows=1_000_000, seed=0):
+    # writes the CSV file in chunks, so files with 10^8 rows don't have to fit into memory
+    # uses the convention of the OELEK files: ";" as seperator, decimal comma, scientific notation
+    rng = numpy.random.default_rng(seed)
+    start_time = 0.0
+    with open(path, "w", encoding="latin-1", newline="") as f:
+        for start_row in range(0, rows, chunk_rows):
+            chunk = generate_chunk(rng, start_row, min(chunk_rows, rows - start_row), columns, start_time)
+            start_time = chunk["time /s"].iloc[-1]
+            if hh_mm_ss_column:
+                chunk.insert(1, HH_MM_SS_COLUMN, hh_mm_ss(chunk["time /s"].to_numpy()))
+            chunk.to_csv(f, sep=";", decimal=",", float_format="%.5E", index=False, header=start_row == 0)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generates CSV files like the ones from OELEK measurements.")
+    parser.add_argument("--rows", type=int, default=1000, help="number of rows (10^3 to 10^8)")
+    parser.add_argument("--columns", type=int, default=3, help="number of columns (3 to 500)")
+    parser.add_argument("--hh-mm-ss", action="store_true", help=f"adds column '{HH_MM_SS_COLUMN}' in hh:mm:ss")
+    parser.add_argument("--out", default="data", help="directory for the CSV file")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    path = os.path.join(args.out, file_name(args.rows, args.columns, args.hh_mm_ss))
+    generate_csv(path, args.rows, args.columns, args.hh_mm_ss, seed=args.seed)
+    print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+# runs without a screen; has to be set before Qt is imported
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+# CSVthis uses paths relative to the repository (config.json, lib/assets, ...)
+REPO_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(REPO_PATH)
+sys.path.insert(0, REPO_PATH)
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from benchmarks.generate_data import generate_csv, file_name, column_names, HH_MM_SS_COLUMN  # noqa: E402
+from lib.utils.profiler import Profiler  # noqa: E402
+from lib.windows.main_window import MainWindow  # noqa: E402
+
+DATA_PATH = os.path.join("benchmarks", "data")  # generated files; not part of the repository
+RESULTS_FILE = os.path.join("benchmarks", "results.jsonl")  # one result per line
+REGRESSION_THRESHOLD = 1.2  # stages which are 20 % slower than the last run are marked
+RENDER_MODES = ("single", "batched")  # settings -> render_mode in config.json
+PAN_FRAMES = 50  # frames drawn while panning for frame rate measurement
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def frame_rate(main_window):
+    # pans through the whole x range in steps of a tenth and draws every frame
+    view_box = main_window.plot_widget.plotItem.vb
+    x_column = main_window.CONFIG["x_axis"]["column"]
+    x_min, x_max = main_window.df[x_column].min(), main_window.df[x_column].max()
+    width = (x_max - x_min) / 10
+
+    start = time.perf_counter()
+    for frame in range(PAN_FRAMES):
+        x_start = x_min + (x_max - x_min - width) * frame / (PAN_FRAMES - 1)
+        view_box.setXRange(x_start, x_start + width, padding=0)
+        QApplication.processEvents()  # rebuilds batched curves
+        main_window.plot_widget.grab()  # draws frame
+    return PAN_FRAMES / (time.perf_counter() - start)
+
+
+def benchmark_render(main_window, name):
+    # loads file again in every render mode and measures frames per second while panning
+    fps = {}
+    config_render_mode = main_window.CONFIG["settings"]["render_mode"]
+    for render_mode in RENDER_MODES:
+        main_window.CONFIG["settings"]["render_mode"] = render_mode
+        main_window.choose_file(name)
+        main_window.plot_widget.enableAutoRange()
+        QApplication.processEvents()
+        fps[render_mode] = frame_rate(main_window)
+    main_window.CONFIG["settings"]["render_mode"] = config_render_mode
+    return fps
+
+
+def benchmark_file(main_window, rows, columns, hh_mm_ss, max_analyse_rows, render):
+    # generates file once and reuses it for later runs
+    name = file_name(rows, columns, hh_mm_ss)
+    path = os.path.join(DATA_PATH, name)
+    if not os.path.exists(path):
+        generate_csv(path, rows, columns, hh_mm_ss)
+
+    # plots every generated column on the secondary axis of config.json
+    config = main_window.CONFIG
+    extra_columns = column_names(columns)[3:]
+    config["secondary_y_axes"][0]["columns"] = ["E /V"] + extra_columns
+    config["settings"]["column_in_hh_mm_ss"] = HH_MM_SS_COLUMN if hh_mm_ss else False
+
+    # loads file like choosing it in the dropdown; profiler measures every stage
+    main_window.csv_path = DATA_PATH
+    main_window.profiler = Profiler(True)
+    start = time.perf_counter()
+    main_window.choose_file(name)
+    QApplication.processEvents()  # draws plot
+    stages = {record["name"]: record["duration"] for record in main_window.profiler.finished_records()}
+    stages["choose_file"] = time.perf_counter() - start
+
+    # calculation of the analyse window over the whole file
+    if rows <= max_analyse_rows:
+        main_window.close_analyse_window()  # new window for the loaded file
+        main_window.analyse_data()
+        analyse_window = main_window.analyse_window
+        x_column = config["x_axis"]["column"]
+        analyse_window.start_x_val = main_window.df[x_column].iloc[0]
+        analyse_window.end_x_val = main_window.df[x_column].iloc[-1]
+        start = time.perf_counter()
+        analyse_window.calculation()
+        stages["calculation"] = time.perf_counter() - start
+        main_window.close_analyse_window()
+
+    result = {
+        "file": name,
+        "rows": rows,
+        "columns": columns,
+        "hh_mm_ss": hh_mm_ss,
+        "stages": stages,
+        "counters": dict(main_window.profiler.counters)
+    }
+    if render:
+        result["fps"] = benchmark_render(main_window, name)
+    return result
+
+
+def last_results():
+    # latest result for every file from earlier runs
+    results = {}
+    if os.path.exists(RESULTS_FILE):
+        with open(RESULTS_FILE, "r") as f:
+            for line in f:
+                result = json.loads(line)
+                results[result["file"]] = result
+    return results
+
+
+def print_result(result, previous):
+    print(f"{result['file']}:")
+    for stage, duration in result["stages"].items():
+        line = f"    {stage:<40} {duration * 1000:10.1f} ms"
+        if previous and stage in previous["stages"] and previous["stages"][stage] > 0:
+            ratio = duration / previous["stages"][stage]
+            line += f"  ({(ratio - 1) * 100:+.0f} %)"
+            if ratio > REGRESSION_THRESHOLD:
+                line += "  <-- slower"
+        print(line)
+    for render_mode, fps in result.get("fps", {}).items():
+        line = f"    {'fps ' + render_mode:<40} {fps:10.1f} 1/s"
+        if previous and render_mode in previous.get("fps", {}):
+            ratio = previous["fps"][render_mode] / fps
+            line += f"  ({(1 / ratio - 1) * 100:+.0f} %)"
+            if ratio > REGRESSION_THRESHOLD:
+                line += "  <-- slower"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures loading, calculating and plotting of CSVthis.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6],
+                        help="numbers of rows (10^3 to 10^8)")
+    parser.add_argument("--columns", type=int, nargs="+", default=[3, 50],
+                        help="numbers of columns (3 to 500)")
+    parser.add_argument("--hh-mm-ss", action="store_true", help="adds a column in hh:mm:ss")
+    parser.add_argument("--max-analyse-rows", type=int, default=10 ** 4,
+                        help="skips calculation of the analyse window for bigger files")
+    parser.add_argument("--render", action="store_true",
+                        help="measures frame rate while panning in every render mode")
+    args = parser.parse_args()
+
+    os.makedirs(DATA_PATH, exist_ok=True)
+    app = QApplication(sys.argv)
+    main_window = MainWindow(use_session=False)  # neither restores nor overwrites the session of the user
+    main_window.resize(1600, 900)
+    main_window.show()
+    previous_results = last_results()
+
+    run_info = {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform()
+    }
+
+    with open(RESULTS_FILE, "a") as f:
+        for rows in args.rows:
+            for columns in args.columns:
+                result = benchmark_file(main_window, rows, columns, args.hh_mm_ss, args.max_analyse_rows,
+                                        args.render)
+                result.update(run_info)
+                print_result(result, previous_results.get(result["file"]))
+                f.write(json.dumps(result) + "\n")
+
+    main_window.close()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
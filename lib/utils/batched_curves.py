@@ -0,0 +1,151 @@
+import numpy
+import pyqtgraph as pg
+from PyQt5.QtCore import QTimer
+
+
+class BatchedCurve:
+    # stands in for a PlotCurveItem in curve_list; draws nothing itself, its group draws all curves at once
+    def __init__(self, group, column, y_data):
+        self.group = group
+        self.column = column
+        self.y_data = y_data
+        self.visible = True
+
+    def setVisible(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            self.group.schedule_rebuild()  # many changes in a row lead to one rebuild
+
+    def isVisible(self):
+        return self.visible
+
+
+class GroupCurveItem(pg.PlotCurveItem):
+    # item of a CurveGroup; reports the bounds of the whole data instead of the drawn (clipped) data,
+    # so auto range works the same as with single curves
+    def __init__(self, group, **kwargs):
+        super().__init__(**kwargs)
+        self.group = group
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        bounds = self.group.bounds(ax)
+        if bounds is None:
+            return super().dataBounds(ax, frac, orthoRange)
+        return bounds
+
+
+class CurveGroup:
+    # draws all curves of a ViewBox with the same pen as one PlotCurveItem; curves are separated by NaN,
+    # only data in the visible x range is drawn and nothing is drawn if the ViewBox isn't on screen
+    def __init__(self, vb, x_data, color):
+        self.vb = vb
+        self.x_data = numpy.asarray(x_data, dtype=float)
+        self.x_sorted = bool(numpy.all(self.x_data[1:] >= self.x_data[:-1]))  # needed for clipping and picking
+        self.color = color
+        self.curves = {}  # {column: BatchedCurve}
+        self.x_bounds = (numpy.nanmin(self.x_data), numpy.nanmax(self.x_data)) if len(self.x_data) else None
+        self.item = GroupCurveItem(self, pen=pg.mkPen(color=color), connect="finite")
+        self.rebuild_pending = False
+        self.rendered_points = 0  # number of points drawn by the last rebuild
+
+        # rebuilds when visible x range or size of ViewBox changes
+        self.vb.sigXRangeChanged.connect(self.schedule_rebuild)
+        self.vb.sigResized.connect(self.schedule_rebuild)
+
+    def add_curve(self, column, y_data):
+        curve = BatchedCurve(self, column, numpy.asarray(y_data, dtype=float))
+        finite = curve.y_data[numpy.isfinite(curve.y_data)]
+        curve.y_bounds = (finite.min(), finite.max()) if len(finite) else None
+        self.curves[column] = curve
+        return curve
+
+    def detach(self):
+        # disconnects signals and removes item before a new file is plotted; plot_widget.clear() doesn't
+        # remove items which were added to the main ViewBox directly
+        for signal in (self.vb.sigXRangeChanged, self.vb.sigResized):
+            try:
+                signal.disconnect(self.schedule_rebuild)
+            except TypeError:
+                pass  # already disconnected
+        self.vb.removeItem(self.item)
+        self.curves = {}
+
+    def schedule_rebuild(self, *args):
+        if not self.rebuild_pending:
+            self.rebuild_pending = True
+            QTimer.singleShot(0, self.rebuild)
+
+    def bounds(self, ax):
+        # (min, max) of the whole data of all visible curves for x (ax = 0) or y (ax = 1); see GroupCurveItem
+        if ax == 0:
+            return self.x_bounds
+        y_bounds = [curve.y_bounds for curve in self.curves.values() if curve.visible and curve.y_bounds is not None]
+        if not y_bounds:
+            return None
+        return min(bounds[0] for bounds in y_bounds), max(bounds[1] for bounds in y_bounds)
+
+    def visible_rows(self):
+        # rows in visible x range plus one row on both sides, so lines leave the view correctly
+        n_rows = len(self.x_data)
+        if not self.x_sorted or n_rows < 3:
+            return slice(0, n_rows)
+        x_min, x_max = self.vb.viewRange()[0]
+        start = max(numpy.searchsorted(self.x_data, x_min, side="left") - 1, 0)
+        stop = min(numpy.searchsorted(self.x_data, x_max, side="right") + 1, n_rows)
+        return slice(start, stop)
+
+    def on_screen(self):
+        rect = self.vb.sceneBoundingRect()
+        return self.vb.isVisible() and rect.width() > 0 and rect.height() > 0
+
+    def rebuild(self):
+        self.rebuild_pending = False
+        visible_curves = [curve for curve in self.curves.values() if curve.visible]
+        if not visible_curves or not self.on_screen():
+            self.item.setVisible(False)
+            self.rendered_points = 0
+            return
+
+        rows = self.visible_rows()
+        x_parts, y_parts = [], []
+        for curve in visible_curves:
+            x_part = self.x_data[rows]
+            y_part = curve.y_data[rows]
+            x_parts += [x_part, [numpy.nan]]  # NaN separates curves
+            y_parts += [y_part, [numpy.nan]]
+
+        self.item.setData(numpy.concatenate(x_parts), numpy.concatenate(y_parts), connect="finite")
+        self.rendered_points = sum(len(y_part) for y_part in y_parts[::2])  # without NaN separators
+        self.item.setVisible(True)
+
+    def pick(self, scene_pos, tolerance=5):
+        # finds nearest visible curve to a click by looking up the x position (binary search) instead of
+        # hit testing every item; returns (column, distance in pixels) or (None, None)
+        if not self.x_sorted or not self.item.isVisible():
+            return None, None
+        view_pos = self.vb.mapSceneToView(scene_pos)
+        pixel_width, pixel_height = self.vb.viewPixelSize()
+        if pixel_width == 0 or pixel_height == 0:
+            return None, None
+
+        # neighbouring rows of the click
+        row = numpy.searchsorted(self.x_data, view_pos.x())
+        rows = numpy.arange(max(row - 1, 0), min(row + 1, len(self.x_data)))
+        if len(rows) == 0:
+            return None, None
+
+        best_column, best_distance = None, None
+        for column, curve in self.curves.items():
+            if not curve.visible:
+                continue
+            y_values = curve.y_data[rows]
+            # y value on line between neighbouring rows
+            if len(rows) == 2 and self.x_data[rows[1]] != self.x_data[rows[0]]:
+                ratio = (view_pos.x() - self.x_data[rows[0]]) / (self.x_data[rows[1]] - self.x_data[rows[0]])
+                y_line = y_values[0] + min(max(ratio, 0), 1) * (y_values[1] - y_values[0])
+            else:
+                y_line = y_values[0]
+            distance = abs(y_line - view_pos.y()) / pixel_height
+            if numpy.isfinite(distance) and distance <= tolerance and (best_distance is None or distance < best_distance):
+                best_column, best_distance = column, distance
+        return best_column, best_distance
@@ -0,0 +1,115 @@
+import gzip
+import io
+import queue
+import threading
+import zipfile
+
+# file endings of compressed CSV files which are shown in the dropdown
+COMPRESSED_SUFFIXES = (".csv.gz", ".csv.zst", ".zip")
+
+CHUNK_SIZE = 1024 * 1024  # bytes decompressed at once
+READ_AHEAD_CHUNKS = 8  # decompressed chunks waiting for the parser
+
+
+class ReadAheadReader(io.RawIOBase):
+    # decompresses a stream in a second thread while pandas parses the chunks before;
+    # zlib and zstd release the GIL, so decompressing and parsing run at the same time
+    def __init__(self, source):
+        super().__init__()
+        self.source = source
+        self.chunks = queue.Queue(maxsize=READ_AHEAD_CHUNKS)
+        self.buffer = b""
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.decompress, daemon=True)
+        self.thread.start()
+
+    def decompress(self):
+        try:
+            while not self.stopped.is_set():
+                chunk = self.source.read(CHUNK_SIZE)
+                self.put(chunk)
+                if not chunk:
+                    return  # end of file
+        except Exception as e:
+            self.put(e)  # raised in readinto()
+
+    def put(self, item):
+        # waits for free space in queue; stops waiting if reader is closed
+        while not self.stopped.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if not self.buffer:
+            chunk = self.chunks.get()
+            if isinstance(chunk, Exception):
+                raise chunk
+            if not chunk:
+                self.chunks.put(chunk)  # keeps end of file for further reads
+                return 0
+            self.buffer = chunk
+        n = min(len(b), len(self.buffer))
+        b[:n] = self.buffer[:n]
+        self.buffer = self.buffer[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self.stopped.set()
+            self.thread.join()
+            self.source.close()
+        super().close()
+
+
+def is_compressed(file_name):
+    return file_name.lower().endswith(COMPRESSED_SUFFIXES)
+
+
+class ZipMember:
+    # file in a zip archive; closing the member alone keeps the archive open (and locked on Windows)
+    def __init__(self, archive, name):
+        self.archive = archive
+        self.member = archive.open(name)
+
+    def read(self, size=-1):
+        return self.member.read(size)
+
+    def close(self):
+        self.member.close()
+        self.archive.close()
+
+
+def open_zip_member(path):
+    # first CSV file in the zip archive
+    archive = zipfile.ZipFile(path)
+    try:
+        for name in archive.namelist():
+            if name.lower().endswith(".csv"):
+                return ZipMember(archive, name)
+    except Exception:
+        archive.close()
+        raise
+    archive.close()
+    raise ValueError(f"Zip archive '{path}' doesn't contain a CSV file.")
+
+
+def open_csv(path):
+    # opens plain or compressed CSV file as binary stream for pandas.read_csv; decompresses in chunks
+    # without writing temporary files
+    lower_path = path.lower()
+    if lower_path.endswith(".gz"):
+        source = gzip.open(path, "rb")
+    elif lower_path.endswith(".zst"):
+        import zstandard  # optional; only needed for .csv.zst files
+        source = zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    elif lower_path.endswith(".zip"):
+        source = open_zip_member(path)
+    else:
+        return open(path, "rb")
+    return io.BufferedReader(ReadAheadReader(source), buffer_size=CHUNK_SIZE)
@@ -0,0 +1,141 @@
+import os
+import numpy
+import pandas
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# file filters for QFileDialog and their export format
+EXPORT_FORMATS = {
+    "CSV (*.csv)": "csv",
+    "Parquet (*.parquet)": "parquet",
+    "HDF5 (*.h5)": "hdf5"
+}
+
+
+def range_rows(x_data, x_start, x_end):
+    # rows with x_start <= x <= x_end; returns a slice for sorted x data (no copy) or an array of row numbers
+    x_data = numpy.asarray(x_data)
+    if numpy.all(x_data[1:] >= x_data[:-1]):
+        return slice(numpy.searchsorted(x_data, x_start, side="left"),
+                     numpy.searchsorted(x_data, x_end, side="right"))
+    return numpy.flatnonzero((x_data >= x_start) & (x_data <= x_end))
+
+
+class ExportWorker(QThread):
+    # writes selected columns and x range of a dataframe chunk by chunk, so no second full dataframe is created
+    progress = pyqtSignal(int)  # percent
+    failed = pyqtSignal(str)  # error message
+
+    def __init__(self, df, columns, x_column, x_start, x_end, filename, file_format, seperator,
+                 chunk_rows=100_000):
+        super().__init__()
+        self.df = df
+        self.columns = columns
+        self.x_column = x_column
+        self.x_start = x_start
+        self.x_end = x_end
+        self.filename = filename
+        self.file_format = file_format
+        self.seperator = seperator
+        self.chunk_rows = chunk_rows
+        self.completed = False  # False after an error or interruption; the incomplete file is deleted then
+        self.file_opened = False  # an existing file is only deleted if it was already overwritten
+
+    def chunks(self):
+        rows = range_rows(self.df[self.x_column].to_numpy(), self.x_start, self.x_end)
+        column_positions = [self.df.columns.get_loc(column) for column in self.columns]
+
+        if isinstance(rows, slice):
+            n_rows = rows.stop - rows.start
+            for start in range(0, n_rows, self.chunk_rows):
+                stop = min(start + self.chunk_rows, n_rows)
+                yield self.df.iloc[rows.start + start:rows.start + stop, column_positions], stop, n_rows
+        else:
+            n_rows = len(rows)
+            for start in range(0, n_rows, self.chunk_rows):
+                stop = min(start + self.chunk_rows, n_rows)
+                yield self.df.iloc[rows[start:stop], column_positions], stop, n_rows
+
+    def run(self):
+        # write functions return False if they were interrupted
+        try:
+            if self.file_format == "csv":
+                self.completed = self.write_csv()
+            elif self.file_format == "parquet":
+                self.completed = self.write_parquet()
+            elif self.file_format == "hdf5":
+                self.completed = self.write_hdf5()
+            else:
+                self.failed.emit(f"Unbekanntes Format '{self.file_format}'.")
+                return  # nothing was written
+        except ImportError as e:
+            self.failed.emit(f"Für das Format '{self.file_format}' fehlt ein Python-Paket: {e.name}")
+        except Exception as e:
+            self.failed.emit(str(e))
+
+        if not self.completed and self.file_opened:
+            self.remove_incomplete_file()
+
+    def remove_incomplete_file(self):
+        try:
+            os.remove(self.filename)
+        except OSError:
+            pass  # file wasn't created
+
+    def emit_progress(self, done, total):
+        self.progress.emit(100 if total == 0 else int(done * 100 / total))
+
+    def write_csv(self):
+        # same convention as the CSV files in /data, so exported files can be opened with CSVthis
+        self.file_opened = True
+        with open(self.filename, "w", encoding="latin-1", newline="") as f:
+            header = True
+            for chunk, done, total in self.chunks():
+                if self.isInterruptionRequested():
+                    return False
+                chunk.to_csv(f, sep=self.seperator, decimal=",", index=False, header=header)
+                header = False
+                self.emit_progress(done, total)
+            if header:  # no rows in range; writes header only
+                self.df.iloc[:0][self.columns].to_csv(f, sep=self.seperator, index=False)
+                self.emit_progress(0, 0)
+        return True
+
+    def write_parquet(self):
+        import pyarrow
+        import pyarrow.parquet
+
+        writer = None
+        try:
+            for chunk, done, total in self.chunks():
+                if self.isInterruptionRequested():
+                    return False
+                table = pyarrow.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    self.file_opened = True
+                    writer = pyarrow.parquet.ParquetWriter(self.filename, table.schema)
+                writer.write_table(table)
+                self.emit_progress(done, total)
+            if writer is None:  # no rows in range; writes empty table
+                self.file_opened = True
+                pyarrow.parquet.write_table(pyarrow.Table.from_pandas(self.df.iloc[:0][self.columns],
+                                                                      preserve_index=False), self.filename)
+                self.emit_progress(0, 0)
+        finally:
+            if writer is not None:
+                writer.close()
+        return True
+
+    def write_hdf5(self):
+        import tables  # noqa: F401  # pandas needs PyTables for HDF5; raises ImportError with package name
+
+        self.file_opened = True
+        with pandas.HDFStore(self.filename, mode="w") as store:
+            for chunk, done, total in self.chunks():
+                if self.isInterruptionRequested():
+                    return False
+                store.append("data", chunk, format="table", index=False)
+                self.emit_progress(done, total)
+            if "data" not in store:  # no rows in range
+                store.put("data", self.df.iloc[:0][self.columns], format="table")
+                self.emit_progress(0, 0)
+        return True
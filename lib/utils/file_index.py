@@ -0,0 +1,210 @@
+import json
+import os
+import sqlite3
+from datetime import datetime
+import pandas
+from PyQt5.QtCore import QThread, pyqtSignal
+from lib.utils.compressed import open_csv, COMPRESSED_SUFFIXES
+
+# path of the SQLite file which stores the metadata of every CSV file in /data
+INDEX_PATH = "lib/cache/file_index.sqlite"
+
+# file endings which are shown in the dropdown
+CSV_SUFFIXES = (".csv",) + COMPRESSED_SUFFIXES
+
+
+def parse_file_name(file_name):
+    # splits file name yymmdd_hhmm_xyz into timestamp and hint; returns (None, file_name) if it doesn't match
+    name = os.path.basename(file_name)
+    try:
+        timestamp = datetime(2000 + int(name[:2]), int(name[2:4]), int(name[4:6]), int(name[7:9]), int(name[9:11]))
+    except ValueError:
+        return None, name
+    return timestamp, name[12:]
+
+
+def is_csv_file(file_name):
+    return file_name.lower().endswith(CSV_SUFFIXES)
+
+
+class FileIndex:
+    # small wrapper around the SQLite index; every thread has to create its own FileIndex object
+    def __init__(self, path=INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, "
+            "size INTEGER, "
+            "mtime REAL, "
+            "columns TEXT, "
+            "row_count INTEGER, "
+            "x_min REAL, "
+            "x_max REAL, "
+            "timestamp TEXT, "
+            "indexed INTEGER DEFAULT 0)"
+        )
+        self.connection.commit()
+
+    def close(self):
+        self.connection.close()
+
+    def entries(self, search=""):
+        # returns every indexed file as dict, newest measurement first; search filters path (case insensitive)
+        # % and _ (separator in file names) are searched as text, not as wildcards of LIKE
+        search = search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        cursor = self.connection.execute(
+            "SELECT path, size, mtime, columns, row_count, x_min, x_max, timestamp, indexed FROM files "
+            "WHERE path LIKE ? ESCAPE '\\' ORDER BY timestamp IS NULL, timestamp DESC, path",
+            (f"%{search}%",)
+        )
+        return [self._to_dict(row) for row in cursor.fetchall()]
+
+    def entry(self, path):
+        cursor = self.connection.execute(
+            "SELECT path, size, mtime, columns, row_count, x_min, x_max, timestamp, indexed FROM files WHERE path = ?",
+            (path,)
+        )
+        row = cursor.fetchone()
+        return self._to_dict(row) if row else None
+
+    def stat(self):
+        # returns {path: (size, mtime)} to find changed files
+        cursor = self.connection.execute("SELECT path, size, mtime, indexed FROM files")
+        return {path: (size, mtime, indexed) for path, size, mtime, indexed in cursor.fetchall()}
+
+    def add_file(self, path, size, mtime):
+        # adds file without metadata, so it can be shown in the dropdown before it is indexed
+        timestamp, _ = parse_file_name(path)
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime, timestamp, indexed) VALUES (?, ?, ?, ?, 0)",
+            (path, size, mtime, timestamp.isoformat() if timestamp else None)
+        )
+
+    def set_metadata(self, path, columns, row_count, x_min, x_max):
+        self.connection.execute(
+            "UPDATE files SET columns = ?, row_count = ?, x_min = ?, x_max = ?, indexed = 1 WHERE path = ?",
+            (json.dumps(columns), row_count, x_min, x_max, path)
+        )
+
+    def remove_file(self, path):
+        self.connection.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def commit(self):
+        self.connection.commit()
+
+    @staticmethod
+    def _to_dict(row):
+        path, size, mtime, columns, row_count, x_min, x_max, timestamp, indexed = row
+        return {
+            "path": path,
+            "size": size,
+            "mtime": mtime,
+            "columns": json.loads(columns) if columns else [],
+            "row_count": row_count,
+            "x_min": x_min,
+            "x_max": x_max,
+            "timestamp": datetime.fromisoformat(timestamp) if timestamp else None,
+            "indexed": bool(indexed)
+        }
+
+
+class FileIndexer(QThread):
+    # scans /data recursively in the background and saves metadata of new or changed CSV files in the index
+    files_listed = pyqtSignal()  # emitted after new files were added (without metadata)
+    directories_found = pyqtSignal(list)  # every directory below /data, needed for the file watcher
+
+    def __init__(self, csv_path, config, index_path=INDEX_PATH):
+        super().__init__()
+        self.csv_path = csv_path
+        self.CONFIG = config
+        self.index_path = index_path
+
+    def run(self):
+        index = FileIndex(self.index_path)
+        known_files = index.stat()
+
+        # lists every CSV file and directory below /data
+        found_files = {}
+        directories = []
+        for root, dirs, files in os.walk(self.csv_path):
+            directories.append(root)
+            for file_name in files:
+                if not is_csv_file(file_name):
+                    continue
+                full_path = os.path.join(root, file_name)
+                rel_path = os.path.relpath(full_path, self.csv_path).replace(os.sep, "/")
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue  # file was removed while scanning
+                found_files[rel_path] = (stat.st_size, stat.st_mtime)
+        self.directories_found.emit(directories)
+
+        # removes deleted files and adds new or changed files without metadata
+        for path in known_files:
+            if path not in found_files:
+                index.remove_file(path)
+        to_index = []
+        for path, (size, mtime) in found_files.items():
+            known = known_files.get(path)
+            if known is None or known[0] != size or known[1] != mtime:
+                index.add_file(path, size, mtime)
+                to_index.append(path)
+            elif not known[2]:
+                to_index.append(path)  # metadata is still missing from an interrupted scan
+        index.commit()
+        self.files_listed.emit()
+
+        # extracts metadata; runs without blocking the GUI
+        for path in to_index:
+            if self.isInterruptionRequested():
+                break
+            try:
+                metadata = self.read_metadata(os.path.join(self.csv_path, path))
+            except Exception as e:
+                print(f"Couldn't index file '{path}':", e)
+                continue
+            if metadata is None:
+                break  # interrupted while reading; file stays without metadata and is indexed next time
+            columns, row_count, x_min, x_max = metadata
+            index.set_metadata(path, columns, row_count, x_min, x_max)
+            index.commit()
+
+        index.close()
+
+    def read_metadata(self, file):
+        # returns None if interruption was requested (e.g. app is closed) while reading a big file
+        sep = self.CONFIG["settings"]["seperator"]
+        x_column = self.CONFIG["x_axis"]["column"]
+
+        # header columns
+        with open_csv(file) as f:
+            header = pandas.read_csv(f, encoding='latin-1', sep=sep, nrows=0)
+        columns = header.columns.tolist()
+
+        # counts rows and gets range of the x column; reads only the x column in chunks to save memory
+        row_count = 0
+        x_min, x_max = None, None
+        use_x = x_column in columns
+        with open_csv(file) as f:
+            reader = pandas.read_csv(f, encoding='latin-1', sep=sep, chunksize=250_000, dtype=str,
+                                     usecols=[x_column] if use_x else [0])
+            for chunk in reader:
+                if self.isInterruptionRequested():
+                    return None
+                row_count += len(chunk)
+                if not use_x:
+                    continue
+                x_data = chunk[x_column]
+                if x_column == self.CONFIG["settings"]["column_in_hh_mm_ss"]:
+                    parts = x_data.str.split(':', expand=True).astype(float)
+                    x_data = parts[0] * 3600 + parts[1] * 60 + parts[2]
+                else:
+                    x_data = pandas.to_numeric(x_data.str.replace(',', '.'), errors='coerce')
+                chunk_min, chunk_max = x_data.min(), x_data.max()
+                if pandas.notna(chunk_min):
+                    x_min = chunk_min if x_min is None else min(x_min, chunk_min)
+                    x_max = chunk_max if x_max is None else max(x_max, chunk_max)
+
+        return columns, row_count, None if x_min is None else float(x_min), None if x_max is None else float(x_max)
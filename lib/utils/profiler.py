@@ -0,0 +1,94 @@
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Profiler:
+    # measures time and memory of every stage of loading, calculating and plotting data
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.records = []  # one dict per measured stage
+        self.counters = {}  # e.g. number of rendered points
+        self.origin = time.perf_counter()  # start time of the chrome trace
+
+        # tracemalloc slows down memory allocation, so it only runs if profiling is enabled
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def reset(self):
+        self.records = []
+        self.counters = {}
+
+    @contextmanager
+    def stage(self, name, category="stage"):
+        if not self.enabled:
+            yield
+            return
+
+        depth = sum(1 for record in self.records if record["end"] is None)  # nested stages are indented
+        record = {"name": name, "category": category, "depth": depth, "end": None}
+        self.records.append(record)
+        memory_start = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record["end"] = time.perf_counter()
+            record["start"] = start
+            record["duration"] = record["end"] - start
+            record["memory_delta"] = tracemalloc.get_traced_memory()[0] - memory_start
+
+    def count(self, name, value):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def finished_records(self):
+        return [record for record in self.records if record["end"] is not None]
+
+    def summary(self):
+        # short text for the status bar; top level stages only
+        parts = [f"{record['name']}: {record['duration'] * 1000:.0f} ms"
+                 for record in self.finished_records() if record["depth"] == 0]
+        parts += [f"{name}: {value}" for name, value in self.counters.items()]
+        return " | ".join(parts)
+
+    def export_json(self, filename):
+        data = {
+            "stages": [
+                {
+                    "name": record["name"],
+                    "category": record["category"],
+                    "depth": record["depth"],
+                    "duration_ms": record["duration"] * 1000,
+                    "memory_delta_bytes": record["memory_delta"]
+                }
+                for record in self.finished_records()
+            ],
+            "counters": self.counters
+        }
+        with open(filename, "w") as f:
+            json.dump(data, f, indent=4)
+
+    def export_chrome_trace(self, filename):
+        # can be opened in chrome://tracing or https://ui.perfetto.dev
+        events = [
+            {
+                "name": record["name"],
+                "cat": record["category"],
+                "ph": "X",  # complete event with duration
+                "ts": (record["start"] - self.origin) * 1e6,  # microseconds
+                "dur": record["duration"] * 1e6,
+                "pid": os.getpid(),
+                "tid": 0,
+                "args": {"memory_delta_bytes": record["memory_delta"]}
+            }
+            for record in self.finished_records()
+        ]
+        events += [
+            {"name": name, "ph": "C", "ts": 0, "pid": os.getpid(), "tid": 0, "args": {name: value}}
+            for name, value in self.counters.items()
+        ]
+        with open(filename, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,99 @@
+import numpy
+import pandas
+
+# methods which can be used in config.json (settings -> resample -> method)
+RESAMPLE_METHODS = ("mean", "envelope", "ffill")
+
+
+def bin_index(x_data, interval):
+    # number of the bin (width = interval) for every x value, starting at the smallest x value
+    x_data = numpy.asarray(x_data, dtype=float)
+    return numpy.floor((x_data - numpy.nanmin(x_data)) / interval).astype(numpy.int64)
+
+
+def aggregate(df, x_column, interval, functions=("mean", "min", "max")):
+    # groups all numeric columns in bins of the x column; returns {function: dataframe}
+    # x column of every result contains the start of the bin, so all results share the same x grid
+    # rows without x value (e.g. empty cells) don't belong to any bin
+    numeric_df = df.select_dtypes("number")
+    numeric_df = numeric_df[numpy.isfinite(numeric_df[x_column].to_numpy(dtype=float))]
+    x_data = numeric_df[x_column].to_numpy()
+    bins = bin_index(x_data, interval)
+
+    grouped = numeric_df.drop(columns=x_column).groupby(bins, sort=True).agg(list(functions))
+    x_grid = numpy.nanmin(x_data) + grouped.index.to_numpy() * interval
+
+    result = {}
+    for function in functions:
+        function_df = grouped.xs(function, axis=1, level=1)
+        function_df.insert(0, x_column, x_grid)
+        result[function] = function_df.reset_index(drop=True)
+    return result
+
+
+def resample_mean(df, x_column, interval):
+    # mean of every bin
+    return aggregate(df, x_column, interval, ("mean",))["mean"]
+
+
+def resample_envelope(df, x_column, interval):
+    # min and max of every bin as two rows with the same x value; drawn as vertical line per bin
+    aggregated = aggregate(df, x_column, interval, ("min", "max"))
+    return envelope_to_curve(aggregated["min"], aggregated["max"])
+
+
+def envelope_to_curve(min_df, max_df):
+    # interleaves min and max rows: min_0, max_0, min_1, max_1, ...
+    envelope = pandas.concat([min_df, max_df]).sort_index(kind="stable")
+    return envelope.reset_index(drop=True)
+
+
+def resample_ffill(df, x_column, interval):
+    # takes the last value before every point of a fixed x grid (forward fill); expects rising x values
+    df = df[numpy.isfinite(df[x_column].to_numpy(dtype=float))]  # rows without x value are dropped
+    df = df.sort_values(x_column, kind="stable") if not df[x_column].is_monotonic_increasing else df
+    x_data = df[x_column].to_numpy(dtype=float)
+    x_grid = numpy.arange(x_data[0], x_data[-1] + interval / 2, interval)
+
+    rows = numpy.searchsorted(x_data, x_grid, side="right") - 1
+    resampled = df.iloc[rows].reset_index(drop=True)
+    resampled[x_column] = x_grid
+    return resampled
+
+
+def resample(df, x_column, interval, method):
+    if method == "mean":
+        return resample_mean(df, x_column, interval)
+    elif method == "envelope":
+        return resample_envelope(df, x_column, interval)
+    elif method == "ffill":
+        return resample_ffill(df, x_column, interval)
+    raise ValueError(f"Unknown resample method '{method}'. Use one of {', '.join(RESAMPLE_METHODS)}.")
+
+
+def build_tiers(df, x_column, intervals):
+    # pre-aggregates data for every interval; returns {interval: {"mean": df, "min": df, "max": df}}
+    tiers = {}
+    for interval in sorted(intervals):
+        tiers[interval] = aggregate(df, x_column, interval)
+    return tiers
+
+
+def overview_envelope(df, x_column, columns, bins=1000):
+    # min/max envelope of every column scaled to 0...1, so curves of different axes fit in one overview;
+    # returns x data and {column: y data} with two rows per bin (see envelope_to_curve())
+    x_data = df[x_column].to_numpy(dtype=float)
+    df, x_data = df[numpy.isfinite(x_data)], x_data[numpy.isfinite(x_data)]  # rows without x value
+    if len(x_data) == 0:
+        return numpy.array([]), {column: numpy.array([]) for column in columns}
+    x_range = x_data.max() - x_data.min()
+    interval = x_range / bins if x_range > 0 else 1
+    aggregated = aggregate(df[[x_column] + columns], x_column, interval, ("min", "max"))
+    envelope = envelope_to_curve(aggregated["min"], aggregated["max"])
+
+    y_data = {}
+    for column in columns:
+        y = envelope[column].to_numpy(dtype=float)
+        y_min, y_max = numpy.nanmin(y), numpy.nanmax(y)
+        y_data[column] = (y - y_min) / (y_max - y_min) if y_max > y_min else numpy.full_like(y, 0.5)
+    return envelope[x_column].to_numpy(dtype=float), y_data
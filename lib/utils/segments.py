@@ -0,0 +1,58 @@
+import numpy
+import pandas
+
+# rows of the calc table in the analyse window: mean, standard deviation, max deviation, integral
+STATISTICS = ("mean", "std", "delta_max", "integral")
+
+
+def detect_segments(df, thresholds, min_points=1):
+    # splits data into segments (e.g. constant current phases); a new segment starts when the
+    # absolute difference of two rows is bigger than the threshold in one of the columns
+    # thresholds = {column: threshold}; returns segment number for every row
+    boundary = numpy.zeros(len(df), dtype=bool)
+    for column, threshold in thresholds.items():
+        boundary[1:] |= numpy.abs(numpy.diff(df[column].to_numpy(dtype=float))) > threshold
+
+    # segments shorter than min_points (e.g. ramps between two phases) are added to the previous segment
+    starts = numpy.flatnonzero(boundary)
+    if len(starts) and min_points > 1:
+        lengths = numpy.diff(numpy.append(starts, len(df)))
+        boundary[starts[lengths < min_points]] = False
+
+    return numpy.cumsum(boundary)
+
+
+def statistics(df, x_column, segment_ids=None):
+    # mean, standard deviation, max deviation from mean and integral (trapezoidal) of every column
+    # for every segment in one pass; returns {statistic: dataframe with one row per segment}
+    if segment_ids is None:
+        segment_ids = numpy.zeros(len(df), dtype=numpy.int64)  # whole dataframe as one segment
+    numeric_df = df.select_dtypes("number")
+    grouped = numeric_df.groupby(segment_ids, sort=True)
+
+    mean = grouped.mean()
+    std = grouped.std(ddof=0)  # population standard deviation
+    deviation = (numeric_df - mean.to_numpy()[numpy.searchsorted(mean.index.to_numpy(), segment_ids)]).abs()
+    delta_max = deviation.groupby(segment_ids, sort=True).max()
+
+    # trapezoid between row i-1 and i belongs to the segment of row i, if both rows are in the same segment
+    x_data = numeric_df[x_column].to_numpy(dtype=float)
+    y_data = numeric_df.to_numpy(dtype=float)
+    trapezoids = numpy.zeros_like(y_data)
+    trapezoids[1:] = (y_data[1:] + y_data[:-1]) / 2 * numpy.diff(x_data)[:, None]
+    trapezoids[1:][segment_ids[1:] != segment_ids[:-1]] = 0
+    integral = pandas.DataFrame(trapezoids, columns=numeric_df.columns).groupby(segment_ids, sort=True).sum()
+
+    return {"mean": mean, "std": std, "delta_max": delta_max, "integral": integral}
+
+
+def segment_index(df, x_column, segment_ids):
+    # first and last row and x value of every segment
+    rows = numpy.arange(len(df))
+    grouped = pandas.Series(rows).groupby(segment_ids, sort=True)
+    index = pandas.DataFrame({"start_row": grouped.min(), "end_row": grouped.max()})
+    x_data = df[x_column].to_numpy()
+    index["x_start"] = x_data[index["start_row"].to_numpy()]
+    index["x_end"] = x_data[index["end_row"].to_numpy()]
+    index["n"] = index["end_row"] - index["start_row"] + 1
+    return index.reset_index(drop=True)
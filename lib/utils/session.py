@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import numpy
+import pandas
+
+# snapshot of the last session: loaded data as .npy files (memory mapped on restore) and state as JSON
+# every snapshot of the data gets a new directory data_*; session.json points to the current one and is
+# replaced in one step, so a failed save never breaks the last snapshot
+SESSION_PATH = "lib/cache/session"
+META_FILE = "session.json"
+DATA_PREFIX = "data_"
+DERIVED_FILE = "derived.pkl"  # tiers, segments and segment statistics
+OBJECT_COLUMNS_FILE = "object_columns.pkl"  # columns which couldn't be converted to float
+
+
+def file_hash(path, chunk_size=4 * 1024 * 1024):
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def config_hash(config):
+    # snapshot is only valid for the same config.json (formulas, resampling, ...)
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+
+def source_info(path, previous_meta=None):
+    # size, modification time and hash of the CSV file; hash of previous snapshot is reused if the file
+    # is unchanged, so big files aren't hashed on every close
+    stat = os.stat(path)
+    info = {"size": stat.st_size, "mtime": stat.st_mtime}
+    if (previous_meta is not None and previous_meta["source"]["path"] == path
+            and previous_meta["source"]["size"] == stat.st_size and previous_meta["source"]["mtime"] == stat.st_mtime):
+        info["hash"] = previous_meta["source"]["hash"]
+    else:
+        info["hash"] = file_hash(path)
+    return info
+
+
+def load_meta(session_path=SESSION_PATH):
+    meta_file = os.path.join(session_path, META_FILE)
+    if not os.path.exists(meta_file):
+        return None
+    with open(meta_file, "r") as f:
+        return json.load(f)
+
+
+def save_data(session_path, df, derived):
+    # writes every numeric column as .npy file into a new directory, so it can be memory mapped on restore;
+    # returns name of the directory and the columns
+    os.makedirs(session_path, exist_ok=True)
+    data_path = tempfile.mkdtemp(prefix=DATA_PREFIX, dir=session_path)
+    try:
+        columns = []
+        object_columns = []
+        for i, column in enumerate(df.columns):
+            if pandas.api.types.is_numeric_dtype(df[column]):
+                numpy.save(os.path.join(data_path, f"column_{i}.npy"), df[column].to_numpy())
+                columns.append({"name": column, "file": f"column_{i}.npy"})
+            else:
+                object_columns.append(column)
+                columns.append({"name": column, "file": None})
+        if object_columns:
+            df[object_columns].to_pickle(os.path.join(data_path, OBJECT_COLUMNS_FILE))
+        pandas.to_pickle(derived, os.path.join(data_path, DERIVED_FILE))
+    except Exception:
+        shutil.rmtree(data_path, ignore_errors=True)
+        raise
+    return os.path.basename(data_path), columns
+
+
+def remove_old_data(session_path, keep):
+    # directories of older snapshots; fails on Windows while restored data is still memory mapped,
+    # these directories are removed after the next save
+    for name in os.listdir(session_path):
+        if name.startswith(DATA_PREFIX) and name != keep:
+            shutil.rmtree(os.path.join(session_path, name), ignore_errors=True)
+
+
+def delete_session(session_path=SESSION_PATH):
+    # removes session.json first, so a snapshot which can't be removed completely is ignored anyway
+    try:
+        os.remove(os.path.join(session_path, META_FILE))
+    except OSError:
+        pass
+    shutil.rmtree(session_path, ignore_errors=True)
+
+
+def save_session(source_path, config, df, derived, state, save_df=True, session_path=SESSION_PATH):
+    # state: visibility, labels, view range and markers; derived: tiers, segments, segment statistics
+    # save_df = False only writes the state (data is unchanged since the last snapshot or restore)
+    try:
+        previous_meta = load_meta(session_path)
+    except ValueError:
+        previous_meta = None  # broken session.json; is replaced
+    if not save_df and (previous_meta is None or "data" not in previous_meta):
+        save_df = True
+
+    if save_df:
+        data, columns = save_data(session_path, df, derived)
+    else:
+        data, columns = previous_meta["data"], previous_meta["columns"]
+    meta = {
+        "source": {"path": source_path, **source_info(source_path, previous_meta)},
+        "config": config_hash(config),
+        "data": data,
+        "columns": columns,
+        "state": state
+    }
+
+    # replaces session.json in one step
+    meta_file = os.path.join(session_path, META_FILE)
+    with open(meta_file + ".tmp", "w") as f:
+        json.dump(meta, f, indent=4)
+    os.replace(meta_file + ".tmp", meta_file)
+    remove_old_data(session_path, data)
+
+
+def load_session(config, session_path=SESSION_PATH):
+    # returns (meta, df, derived) of the last session or None if the CSV file or config.json changed
+    meta = load_meta(session_path)
+    if meta is None or meta["config"] != config_hash(config):
+        return None
+
+    # checks source file; hash is only calculated if size or modification time changed
+    source = meta["source"]
+    if not os.path.exists(source["path"]):
+        return None
+    stat = os.stat(source["path"])
+    if stat.st_size != source["size"]:
+        return None
+    if stat.st_mtime != source["mtime"] and file_hash(source["path"]) != source["hash"]:
+        return None
+
+    # memory maps columns instead of reading them; pages are loaded when they are accessed
+    data_path = os.path.join(session_path, meta["data"])
+    data = {}
+    object_df = None
+    for column in meta["columns"]:
+        if column["file"] is None:
+            if object_df is None:
+                object_df = pandas.read_pickle(os.path.join(data_path, OBJECT_COLUMNS_FILE))
+            data[column["name"]] = object_df[column["name"]]
+        else:
+            data[column["name"]] = numpy.load(os.path.join(data_path, column["file"]), mmap_mode="r")
+    df = pandas.DataFrame(data, copy=False)
+    derived = pandas.read_pickle(os.path.join(data_path, DERIVED_FILE))
+    return meta, df, derived
@@ -0,0 +1,133 @@
+from collections import OrderedDict
+import numpy
+from PyQt5.QtCore import QThread, pyqtSignal
+
+# window functions for FFT, Welch PSD and spectrogram
+WINDOWS = {
+    "Hann": numpy.hanning,
+    "Hamming": numpy.hamming,
+    "Blackman": numpy.blackman,
+    "Rechteck": numpy.ones
+}
+
+MAX_POINTS = 2 ** 22  # maximum number of points after resampling; bigger ranges get a bigger step
+CACHE_SIZE = 32  # number of results kept in cache
+
+
+def even_resample(x_data, y_data, x_start, x_end):
+    # interpolates data of [x_start, x_end] on evenly spaced x values; FFT needs a constant step
+    # step is the median step of the data, so dense parts are not lost and gaps are interpolated
+    x_data = numpy.asarray(x_data, dtype=float)
+    y_data = numpy.asarray(y_data, dtype=float)
+    in_range = (x_data >= x_start) & (x_data <= x_end) & numpy.isfinite(y_data)
+    x_data, y_data = x_data[in_range], y_data[in_range]
+    if len(x_data) < 2:
+        raise ValueError("Zu wenige Datenpunkte im gewählten Bereich.")
+
+    order = numpy.argsort(x_data, kind="stable")
+    x_data, y_data = x_data[order], y_data[order]
+    steps = numpy.diff(x_data)
+    step = numpy.median(steps[steps > 0]) if numpy.any(steps > 0) else 0
+    if step <= 0:
+        raise ValueError("Die x-Werte im gewählten Bereich steigen nicht an.")
+    step = max(step, (x_data[-1] - x_data[0]) / MAX_POINTS)
+
+    x_even = numpy.arange(x_data[0], x_data[-1], step)
+    return x_even, numpy.interp(x_even, x_data, y_data), step
+
+
+def segments(y_data, segment_length, overlap=0.5):
+    # overlapping segments as view (no copy) with shape (number of segments, segment_length)
+    segment_length = min(segment_length, len(y_data))
+    step = max(int(segment_length * (1 - overlap)), 1)
+    return numpy.lib.stride_tricks.sliding_window_view(y_data, segment_length)[::step], step
+
+
+def fft_amplitude(y_data, step, window):
+    # amplitude spectrum of the whole range; mean is removed so the DC part doesn't hide the ripple
+    w = WINDOWS[window](len(y_data))
+    spectrum = numpy.abs(numpy.fft.rfft((y_data - y_data.mean()) * w)) * 2 / w.sum()
+    return numpy.fft.rfftfreq(len(y_data), step), spectrum
+
+
+def segment_psd(segment_data, step, window):
+    # one-sided power spectral density of every segment (rows of segment_data)
+    segment_length = segment_data.shape[1]
+    w = WINDOWS[window](segment_length)
+    detrended = segment_data - segment_data.mean(axis=1, keepdims=True)
+    psd = numpy.abs(numpy.fft.rfft(detrended * w, axis=1)) ** 2 * step / (w ** 2).sum()
+    psd[:, 1:-1 if segment_length % 2 == 0 else None] *= 2  # one-sided; DC and Nyquist exist once
+    return numpy.fft.rfftfreq(segment_length, step), psd
+
+
+def welch_psd(y_data, step, window, segment_length):
+    # mean of the PSD of overlapping segments (Welch's method)
+    segment_data, _ = segments(y_data, segment_length)
+    frequencies, psd = segment_psd(segment_data, step, window)
+    return frequencies, psd.mean(axis=0)
+
+
+def spectrogram(y_data, step, window, segment_length):
+    # PSD of every segment; returns times (middle of segment), frequencies and psd (times x frequencies)
+    segment_data, segment_step = segments(y_data, segment_length)
+    frequencies, psd = segment_psd(segment_data, step, window)
+    times = (numpy.arange(len(segment_data)) * segment_step + segment_data.shape[1] / 2) * step
+    return times, frequencies, psd
+
+
+def spectral_analysis(x_data, y_data, x_start, x_end, mode, window, segment_length):
+    # calculates the result for SpectrumWindow; mode is "FFT", "Welch-PSD" or "Spektrogramm"
+    x_even, y_even, step = even_resample(x_data, y_data, x_start, x_end)
+    result = {"mode": mode, "step": step, "n": len(y_even), "x_start": x_even[0]}
+    if mode == "FFT":
+        result["frequencies"], result["values"] = fft_amplitude(y_even, step, window)
+    elif mode == "Welch-PSD":
+        result["frequencies"], result["values"] = welch_psd(y_even, step, window, segment_length)
+    else:
+        result["times"], result["frequencies"], result["values"] = spectrogram(y_even, step, window, segment_length)
+    return result
+
+
+class SpectralCache:
+    # keeps the last results; key = (column, x_start, x_end, mode, window, segment_length)
+    def __init__(self, size=CACHE_SIZE):
+        self.size = size
+        self.results = OrderedDict()
+
+    def get(self, key):
+        if key in self.results:
+            self.results.move_to_end(key)
+            return self.results[key]
+        return None
+
+    def put(self, key, result):
+        self.results[key] = result
+        self.results.move_to_end(key)
+        if len(self.results) > self.size:
+            self.results.popitem(last=False)  # removes oldest result
+
+
+class SpectrumWorker(QThread):
+    # calculates spectrum in the background, so the plot stays responsive with long ranges
+    result_ready = pyqtSignal(object, object)  # key, result
+    failed = pyqtSignal(str)
+
+    def __init__(self, key, x_data, y_data, x_start, x_end, mode, window, segment_length):
+        super().__init__()
+        self.key = key
+        self.x_data = x_data
+        self.y_data = y_data
+        self.x_start = x_start
+        self.x_end = x_end
+        self.mode = mode
+        self.window = window
+        self.segment_length = segment_length
+
+    def run(self):
+        try:
+            result = spectral_analysis(self.x_data, self.y_data, self.x_start, self.x_end,
+                                       self.mode, self.window, self.segment_length)
+        except (ValueError, MemoryError) as e:
+            self.failed.emit(str(e))
+            return
+        self.result_ready.emit(self.key, result)
@@ -0,0 +1,89 @@
+import json
+import os
+import re
+
+# presets saved in the select window; presets from config.json are not changed
+PRESETS_PATH = "lib/cache/visibility_presets.json"
+
+
+def apply_visibility(plot_widget, vb_list, curve_list, graph_label_list, visibility):
+    # shows/hides many curves and their labels at once; visibility = {column: True/False}
+    # repaints and auto ranges once at the end instead of once per curve
+    view_boxes = [plot_widget.plotItem.vb] + list(vb_list.values())
+    auto_range = [vb.autoRangeEnabled() for vb in view_boxes]
+
+    plot_widget.setUpdatesEnabled(False)
+    for vb in view_boxes:
+        vb.disableAutoRange()
+
+    try:
+        for column, visible in visibility.items():
+            if column not in curve_list:
+                continue
+            curve_list[column].setVisible(visible)
+            if column in graph_label_list:
+                graph_label_list[column].setVisible(visible)
+    finally:
+        # restores auto range; triggers one update per ViewBox
+        for vb, (x_auto, y_auto) in zip(view_boxes, auto_range):
+            if x_auto or y_auto:
+                vb.enableAutoRange(x=x_auto if x_auto else None, y=y_auto if y_auto else None)
+        plot_widget.setUpdatesEnabled(True)
+        plot_widget.viewport().update()
+
+
+def curve_axis(column, config):
+    # name of the axis (from config.json) of a curve
+    if column in config["main_y_axis"]["columns"]:
+        return config["main_y_axis"]["name"]
+    for sec_axis in config["secondary_y_axes"]:
+        if column in sec_axis["columns"]:
+            return sec_axis["name"]
+    for calc_axis in config["calc_y_axes"]:
+        if column == calc_axis["name"]:
+            return calc_axis["name"]
+    return None
+
+
+def preset_visibility(preset, curve_list, config):
+    # returns {column: True/False} for a preset; a curve matches if it is in "columns",
+    # belongs to one of "axes" or its name matches the regex "pattern"
+    # "exclusive": true hides every curve which doesn't match, otherwise only matching curves are shown
+    columns = preset.get("columns", [])
+    axes = preset.get("axes", [])
+    pattern = re.compile(preset["pattern"]) if preset.get("pattern") else None
+
+    visibility = {}
+    for column in curve_list:
+        matches = (column in columns
+                   or curve_axis(column, config) in axes
+                   or (pattern is not None and pattern.search(column) is not None))
+        if matches:
+            visibility[column] = True
+        elif preset.get("exclusive", False):
+            visibility[column] = False
+    return visibility
+
+
+def load_presets(config):
+    # presets from config.json and saved presets
+    presets = list(config["visibility_presets"])
+    if os.path.exists(PRESETS_PATH):
+        with open(PRESETS_PATH, "r") as f:
+            presets += json.load(f)
+    return presets
+
+
+def save_preset(preset):
+    saved_presets = []
+    if os.path.exists(PRESETS_PATH):
+        with open(PRESETS_PATH, "r") as f:
+            saved_presets = json.load(f)
+
+    # replaces saved preset with same name
+    saved_presets = [saved for saved in saved_presets if saved["name"] != preset["name"]]
+    saved_presets.append(preset)
+
+    os.makedirs(os.path.dirname(PRESETS_PATH), exist_ok=True)
+    with open(PRESETS_PATH, "w") as f:
+        json.dump(saved_presets, f, indent=4)
@@ -1,4 +1,4 @@
-import math
+import numpy
 import pandas
 import pyqtgraph as pg
 from PyQt5.QtCore import Qt, QAbstractTableModel, QSize
@@ -12,12 +12,18 @@ from PyQt5.QtWidgets import (
     QMenu,
     QTableWidget,
     QTableWidgetItem,
-    QMessageBox
+    QMessageBox,
+    QComboBox,
+    QListWidget,
+    QPushButton
 )
+from lib.utils.segments import statistics, STATISTICS
+from lib.windows.spectrum_window import SpectrumWindow
 
 
 class AnalyseWindow(QWidget):
-    def __init__(self, vb_list, axis_list, plot_widget, curve_list, df, config):
+    def __init__(self, vb_list, axis_list, plot_widget, curve_list, df, config, df_tiers, segments, segment_stats,
+                 spectral_cache, resampled=False):
         super().__init__()
         # initialises instance variables
         self.vb_list = vb_list
@@ -25,6 +31,12 @@ class AnalyseWindow(QWidget):
         self.plot_widget = plot_widget
         self.curve_list = curve_list
         self.df = df
+        self.raw_df = df  # self.df is replaced by a tier in choose_tier()
+        self.df_tiers = df_tiers
+        self.segments = segments
+        self.segment_stats = segment_stats
+        self.spectral_cache = spectral_cache
+        self.resampled = resampled  # df was resampled while loading (settings -> resample -> method)
         self.CONFIG = config
 
         # select window settings
@@ -42,10 +54,24 @@ class AnalyseWindow(QWidget):
         self.shortcut_exit = QShortcut(QKeySequence("Esc"), self)
         self.shortcut_exit.activated.connect(self.close)  # type: ignore
 
-        # headline
-        self.show_df = QLabel("Datenwerte")
+        # headline; tells if the loaded data was resampled
+        if self.resampled:
+            resample_config = self.CONFIG["settings"]["resample"]
+            self.show_df = QLabel(f"Datenwerte (neu abgetastet: {resample_config['method']}, "
+                                  f"\u0394x = {resample_config['interval']:g})")
+        else:
+            self.show_df = QLabel("Datenwerte")
         self.win_layout.addWidget(self.show_df)
 
+        # dropdown to choose raw data or pre-aggregated data (mean of every bin) for table and calculation
+        self.tier_dropdown = QComboBox()
+        self.tier_dropdown.addItem("Neu abgetastete Daten" if self.resampled else "Rohdaten", None)
+        for interval in self.df_tiers:
+            self.tier_dropdown.addItem(f"Mittelwerte, \u0394x = {interval:g}", interval)
+        self.tier_dropdown.currentIndexChanged.connect(self.choose_tier)  # type: ignore
+        self.tier_dropdown.setVisible(bool(self.df_tiers))
+        self.win_layout.addWidget(self.tier_dropdown)
+
         # data table
         self.data_table = QTableView()
         self.model = PandasModel(self.df)  # creates data model from pandas data for table widget
@@ -60,6 +86,17 @@ class AnalyseWindow(QWidget):
         self.data_table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.data_table.customContextMenuRequested.connect(self.show_context_menu)  # type: ignore
 
+        # list of detected segments; choosing a segment sets start and end
+        self.show_segments = QLabel("Segmente")
+        self.win_layout.addWidget(self.show_segments)
+        self.segment_list = QListWidget()
+        self.segment_list.setMaximumHeight(150)
+        self.fill_segment_list()
+        self.segment_list.currentRowChanged.connect(self.choose_segment)  # type: ignore
+        self.win_layout.addWidget(self.segment_list)
+        self.show_segments.setVisible(self.segments is not None)
+        self.segment_list.setVisible(self.segments is not None)
+
         # headline 2
         self.show_df = QLabel("Auswertung")
         self.win_layout.addWidget(self.show_df)
@@ -75,6 +112,12 @@ class AnalyseWindow(QWidget):
         self.calc_table.setVerticalHeaderLabels(calc_table_row_list)
         self.win_layout.addWidget(self.calc_table)
 
+        # button to open spectrum window for range between start and end
+        self.spectrum_btn = QPushButton("Spektrum")
+        self.spectrum_btn.clicked.connect(self.show_spectrum)  # type: ignore
+        self.win_layout.addWidget(self.spectrum_btn)
+        self.spectrum_window = None
+
         # saves started and end value for calc for calculation()
         self.start_x_val = None
         self.end_x_val = None
@@ -84,6 +127,21 @@ class AnalyseWindow(QWidget):
             stylesheet = qss_file.read()
             self.setStyleSheet(stylesheet)
 
+    def choose_tier(self, index):
+        interval = self.tier_dropdown.itemData(index)
+        if interval is None:
+            self.df = self.raw_df
+        else:
+            self.df = self.df_tiers[interval]["mean"]
+
+        # shows new data in table; marked rows don't match new data
+        self.model = PandasModel(self.df)
+        self.data_table.setModel(self.model)
+
+        # calculates with new data
+        self.calc_table.clearContents()
+        self.calculation()
+
     def show_context_menu(self, position):
         # gets row
         index = self.data_table.indexAt(position)  # index on which rows the user clicked
@@ -104,16 +162,10 @@ class AnalyseWindow(QWidget):
         action = menu.exec_(self.data_table.viewport().mapToGlobal(position))
 
         if action == set_start:
-            self.remove_dashed_line('start')
-            self.draw_dashed_line(x_data, 'start')
-            self.model.highlight_row(row, QColor("green"))
-            self.start_x_val = x_data
+            self.set_start(row, x_data)
             self.calculation()
         elif action == set_end:
-            self.remove_dashed_line('end')
-            self.draw_dashed_line(x_data, 'end')
-            self.model.highlight_row(row, QColor("red"))
-            self.end_x_val = x_data
+            self.set_end(row, x_data)
             self.calculation()
         elif action == unselect:
             self.remove_dashed_line('start')
@@ -121,8 +173,83 @@ class AnalyseWindow(QWidget):
             self.model.unhighlight_rows()
             self.start_x_val = None
             self.end_x_val = None
+            self.segment_list.setCurrentRow(-1)
             self.calc_table.clearContents()
 
+    def show_spectrum(self):
+        # uses whole data if start and end aren't set
+        x_column = self.CONFIG["x_axis"]["column"]
+        x_start, x_end = self.start_x_val, self.end_x_val
+        if x_start is None or x_end is None or x_start >= x_end:
+            x_start, x_end = self.raw_df[x_column].min(), self.raw_df[x_column].max()
+
+        # spectrum is calculated from raw data
+        self.spectrum_window = SpectrumWindow(self.raw_df, self.CONFIG, float(x_start), float(x_end),
+                                              self.spectral_cache)
+        self.spectrum_window.setAttribute(Qt.WA_DeleteOnClose)  # deletes windows on close
+        self.spectrum_window.show()
+
+    def set_start(self, row, x_data):
+        self.remove_dashed_line('start')
+        self.draw_dashed_line(x_data, 'start')
+        self.model.highlight_row(row, QColor("green"))
+        self.start_x_val = x_data
+
+    def set_end(self, row, x_data):
+        self.remove_dashed_line('end')
+        self.draw_dashed_line(x_data, 'end')
+        self.model.highlight_row(row, QColor("red"))
+        self.end_x_val = x_data
+
+    def set_markers(self, start_x, end_x):
+        # sets start and end to the rows nearest to the x values (e.g. from a restored session)
+        x_column = self.CONFIG["x_axis"]["column"]
+        x_data = self.df[x_column].to_numpy(dtype=float)
+        if start_x is not None:
+            row = int(numpy.nanargmin(numpy.abs(x_data - start_x)))
+            self.set_start(row, self.df[x_column].iloc[row])
+        if end_x is not None:
+            row = int(numpy.nanargmin(numpy.abs(x_data - end_x)))
+            self.set_end(row, self.df[x_column].iloc[row])
+        self.calculation()
+
+    def fill_segment_list(self):
+        if self.segments is None:
+            return
+        columns = self.CONFIG["settings"]["segmentation"]["thresholds"]
+        for i, segment in self.segments.iterrows():
+            text = f"{i + 1}: x = {segment['x_start']:g} bis {segment['x_end']:g} ({int(segment['n'])} Werte)"
+            for column in columns:
+                text += f", x\u0304 {column} = {round(self.segment_stats['mean'].loc[i, column], 5):g}"
+            self.segment_list.addItem(text)
+
+    def choose_segment(self, i):
+        if i < 0:
+            return
+
+        # segments belong to raw data
+        if self.df is not self.raw_df:
+            self.tier_dropdown.setCurrentIndex(0)
+
+        # sets start and end to first and last row of segment
+        segment = self.segments.iloc[i]
+        start_row, end_row = int(segment["start_row"]), int(segment["end_row"])
+        self.set_start(start_row, segment["x_start"])
+        self.set_end(end_row, segment["x_end"])
+        self.data_table.scrollTo(self.model.index(start_row, 0), QTableView.PositionAtTop)
+
+        # statistics were calculated while loading the file
+        self.calc_table.clearContents()
+        self.fill_calc_table(self.segment_stats, i)
+
+    def fill_calc_table(self, stats, segment):
+        # writes statistics {statistic: df} of one segment into calc_table
+        for column in stats["mean"].columns:
+            i = self.raw_df.columns.get_loc(column)  # column of calc_table; tiers only contain numeric columns
+            for row, statistic in enumerate(STATISTICS):
+                value = stats[statistic].iloc[segment][column]
+                self.calc_table.setItem(row, i, QTableWidgetItem(str(round(value, 5))))
+
     def draw_dashed_line(self, x_data, location):
         x = [float(x_data), float(x_data)]
         y = [-10, 10]  # doesn't really matter
@@ -155,53 +282,16 @@ class AnalyseWindow(QWidget):
 
     def calculation(self):
         # if every val is set correctly
-        if self.start_x_val and self.end_x_val and self.start_x_val < self.end_x_val:
+        if self.start_x_val is not None and self.end_x_val is not None and self.start_x_val < self.end_x_val:
             calc_df = self.df.loc[self.df[self.CONFIG["x_axis"]["column"]].between(self.start_x_val, self.end_x_val)]
 
-            # starts calculation for every column in df
-            for i, column in enumerate(calc_df.columns.tolist()):
-                n_data_points = len(calc_df)
-
-                # sum
-                data_sum = 0
-                for data in calc_df[column]:
-                    data_sum += data
-
-                # mean
-                mean = data_sum / n_data_points
-                self.calc_table.setItem(0, i, QTableWidgetItem(str(round(mean, 5))))  # row=0 => mean
-
-                # standard deviation
-                sum_deviation_to_mean_quad = 0
-                for data in calc_df[column]:
-                    sum_deviation_to_mean_quad += (data - mean) ** 2
-                standard_deviation = math.sqrt(sum_deviation_to_mean_quad / n_data_points)
-                self.calc_table.setItem(1, i, QTableWidgetItem(
-                    str(round(standard_deviation, 5))))  # row=1 => standard deviation
-
-                # max deviation
-                delta_max = 0
-                for data in calc_df[column]:
-                    delta = abs(data - mean)
-                    if delta > delta_max:
-                        delta_max = delta
-                self.calc_table.setItem(2, i, QTableWidgetItem(
-                    str(round(delta_max, 5))))  # row=2 => max deviation
-
-                # integral (uses trapezoidal integration)
-                integral = 0
-                for i_data, data in enumerate(calc_df[column]):
-                    if i_data == 0:
-                        continue
-                    else:
-                        y_1 = calc_df[column].iloc[i_data - 1]
-                        y_2 = data
-                        x_1 = calc_df[self.CONFIG["x_axis"]["column"]].iloc[i_data - 1]
-                        x_2 = calc_df[self.CONFIG["x_axis"]["column"]].iloc[i_data]
-                        integral += ((y_2 + y_1) / 2) * (x_2 - x_1)  # trapezoidal integration
-                        self.calc_table.setItem(3, i, QTableWidgetItem(str(round(integral, 5))))  # row=3 => integral
-
-        elif self.start_x_val and self.end_x_val and self.start_x_val > self.end_x_val:
+            # calculates mean, standard deviation, max deviation and integral for every column in df
+            if len(calc_df):
+                self.fill_calc_table(statistics(calc_df, self.CONFIG["x_axis"]["column"]), 0)
+            else:
+                self.calc_table.clearContents()  # no data between start and end
+
+        elif self.start_x_val is not None and self.end_x_val is not None and self.start_x_val > self.end_x_val:
             self.calc_table.clearContents()  # clears calc_table
 
             # creates alarm window
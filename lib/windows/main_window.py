@@ -7,7 +7,18 @@ import pyqtgraph as pg
 from lib.windows.select_window import SelectWindow
 from lib.windows.analyse_window import AnalyseWindow
 from lib.windows.loading_window import LoadingWindow
-from PyQt5.QtCore import QSize, Qt, QCoreApplication
+from lib.windows.profile_window import ProfileWindow
+from lib.utils.profiler import Profiler
+from lib.utils.export import ExportWorker, EXPORT_FORMATS
+from lib.utils.segments import detect_segments, segment_index, statistics
+from lib.utils.compressed import open_csv
+from lib.utils.batched_curves import CurveGroup
+from lib.utils.spectral import SpectralCache
+from lib.utils.session import save_session, load_session, delete_session
+from lib.utils.visibility import apply_visibility, curve_axis
+from lib.utils.file_index import FileIndex, FileIndexer, parse_file_name
+from lib.utils.resample import resample, build_tiers, envelope_to_curve, overview_envelope
+from PyQt5.QtCore import QSize, Qt, QCoreApplication, QFileSystemWatcher, QTimer
 from PyQt5.QtGui import QKeySequence
 from PyQt5.QtWidgets import (
     QLabel,
@@ -17,19 +28,22 @@ from PyQt5.QtWidgets import (
     QWidget,
     QComboBox,
     QPushButton,
-    QShortcut
+    QShortcut,
+    QLineEdit,
+    QFileDialog,
+    QProgressBar,
+    QMessageBox
 )
 
 
 # Subclass QMainWindow to customize your application's main window
 class MainWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, use_session=True):
         super().__init__()
 
-        # directory and list of CSV files
+        # directory of CSV files; files are listed by the file index (see start_indexer())
         if os.path.exists("data"):  # checks if folder /data exists
             self.csv_path = "data"
-            self.csv_files = os.listdir("data")
         else:
             # exits programm if folder is missing
             print("Folder /data is missing!")
@@ -39,6 +53,10 @@ class MainWindow(QMainWindow):
         with open('config.json', 'r') as f:
             self.CONFIG = json.load(f)
 
+        # session snapshot is restored on start and saved on close (settings -> restore_session);
+        # use_session = False ignores it, e.g. for benchmarks
+        self.use_session = use_session and self.CONFIG["settings"]["restore_session"]
+
         # main window settings
         self.setWindowTitle(f'{self.CONFIG["settings"]["use_case"]} | Version {self.CONFIG["settings"]["version"]}')
         self.setMinimumSize(QSize(800, 600))
@@ -56,8 +74,12 @@ class MainWindow(QMainWindow):
         # initialise secondary windows
         self.select_window = None
         self.analyse_window = None
+        self.profile_window = None
         self.loading_window = LoadingWindow()
 
+        # measures time and memory of loading, calculating and plotting if enabled in config.json
+        self.profiler = Profiler(self.CONFIG["settings"]["profiling"])
+
         # Shortcut für ESC
         self.shortcut_exit = QShortcut(QKeySequence("Esc"), self)
         self.shortcut_exit.activated.connect(self.close)  # type: ignore
@@ -73,19 +95,21 @@ class MainWindow(QMainWindow):
         self.dropdown_label = QLabel("Datei:")
         self.dropdown_layout.addWidget(self.dropdown_label)
 
-        # dropdown
+        # search field to filter the dropdown
+        self.search_field = QLineEdit()
+        self.search_field.setPlaceholderText("Suchen...")
+        self.search_field.setClearButtonEnabled(True)
+        self.search_field.textChanged.connect(self.fill_dropdown)  # type: ignore
+        self.dropdown_layout.addWidget(self.search_field)
+
+        # dropdown; filled from the file index in fill_dropdown()
+        self.file_index = FileIndex()
         self.dropdown = QComboBox()
-        dropdown_list = self.csv_files
-        dropdown_list.insert(0, "Datei auswählen")
-        self.dropdown.addItems(dropdown_list)
+        self.dropdown.setSizeAdjustPolicy(QComboBox.AdjustToContents)
+        self.fill_dropdown()
         self.dropdown.currentTextChanged.connect(self.choose_file)  # type: ignore
         self.dropdown_layout.addWidget(self.dropdown)
 
-        # deactivates the first item in the dropdown list
-        self.model = self.dropdown.model()
-        self.item = self.model.item(0)
-        self.item.setFlags(self.item.flags() & ~Qt.ItemIsEnabled)
-
         # headline2
         self.headline2 = QLabel("Keine Datei ausgewählt")
         self.dropdown_layout.addWidget(self.headline2)
@@ -102,6 +126,18 @@ class MainWindow(QMainWindow):
         self.analyse_data_btn.setVisible(False)
         self.dropdown_layout.addWidget(self.analyse_data_btn)
 
+        # button to export data
+        self.export_data_btn = QPushButton("Exportieren")
+        self.export_data_btn.clicked.connect(self.export_data)  # type: ignore
+        self.export_data_btn.setVisible(False)
+        self.dropdown_layout.addWidget(self.export_data_btn)
+
+        # button to show profile; only if profiling is enabled in config.json
+        self.profile_btn = QPushButton("Profil")
+        self.profile_btn.clicked.connect(self.show_profile)  # type: ignore
+        self.profile_btn.setVisible(False)
+        self.dropdown_layout.addWidget(self.profile_btn)
+
         # pyqtgraph
         self.plot_widget = pg.PlotWidget()
         self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
@@ -111,12 +147,31 @@ class MainWindow(QMainWindow):
         self.plot_widget.setMouseEnabled(x=True, y=False)  # disables rescaling y-axis
         self.main_layout.addWidget(self.plot_widget)
 
+        # overview under the plot; shows envelope of the whole file and the visible x range of the plot
+        self.overview_widget = pg.PlotWidget()
+        self.overview_widget.setFixedHeight(100)
+        self.overview_widget.setBackground("lightgray")
+        self.overview_widget.hideAxis('left')
+        self.overview_widget.getAxis('bottom').setTextPen('black')
+        self.overview_widget.setMouseEnabled(x=False, y=False)  # moved via overview_region only
+        self.overview_widget.hideButtons()
+        self.overview_widget.setVisible(False)
+        self.main_layout.addWidget(self.overview_widget)
+
+        # draggable window in overview; sets x range of the plot
+        self.overview_region = pg.LinearRegionItem(brush=(0, 0, 255, 40))
+        self.overview_region.setZValue(10)  # draws region above the envelopes
+        self.overview_region.sigRegionChanged.connect(self.overview_region_changed)  # type: ignore
+        self.moving_overview_region = False
+        self.plot_widget.plotItem.vb.sigXRangeChanged.connect(self.plot_range_changed)  # type: ignore
+
         # styles axes
         self.plot_widget.getAxis('bottom').setTextPen('black')
         self.plot_widget.getAxis('left').setTextPen('black')
 
         # initializes lists to save objects and access them later in select window
         self.curve_list = {}  # adds objects in plot_data()
+        self.curve_groups = []  # adds objects in plot_data_batched()
         self.vb_list = {}  # adds objects in adds_axes()
         self.axis_list = {}  # adds objects in adds_axes()
         self.graph_label_list = {}
@@ -126,15 +181,219 @@ class MainWindow(QMainWindow):
 
         # initializes dataframe to save df and access it in different functions
         self.df = None
+        self.df_tiers = {}  # pre-aggregated data {interval: {"mean": df, "min": df, "max": df}}; see resample_data()
+        self.resampled = False  # True if df was resampled; see resample_data()
+        self.segments = None  # first/last row of every segment; see segment_data()
+        self.segment_stats = None  # statistics of every segment {statistic: df}; see segment_data()
+        self.spectral_cache = SpectralCache()  # results of spectrum window; new cache for every new file
+        self.current_file = None  # file name from dropdown
+        self.session_saved = False  # True if data in session snapshot is the same as self.df; see save_current_session()
 
         # adds extra vb for analyse_window to draw dashed lines
         self.add_vb_dashed_line()
 
+        # shows labels of batched curves; see plot_data_batched()
+        self.plot_widget.scene().sigMouseClicked.connect(self.pick_batched_curve)  # type: ignore
+
+        # exports data in the background; shows progress in status bar
+        self.export_worker = None
+        self.export_progress = QProgressBar()
+        self.export_progress.setMaximumWidth(200)
+        self.export_progress.setVisible(False)
+        self.statusBar().addPermanentWidget(self.export_progress)
+
+        # scans /data in the background and watches it for new, changed or removed files
+        self.indexer = None
+        self.rescan_requested = False
+        self.file_watcher = QFileSystemWatcher()
+        self.file_watcher.directoryChanged.connect(self.schedule_rescan)  # type: ignore
+        self.file_watcher.fileChanged.connect(self.schedule_rescan)  # type: ignore  # changed content of a file
+        self.rescan_timer = QTimer()
+        self.rescan_timer.setSingleShot(True)
+        self.rescan_timer.setInterval(500)  # waits until copying of files has finished
+        self.rescan_timer.timeout.connect(self.start_indexer)  # type: ignore
+        self.start_indexer()
+
+        # restores file, curves, labels, view range and markers of the last session if enabled in config.json
+        if self.use_session:
+            self.restore_session()
+
     def load_stylesheet(self, filename):
         with open(filename, "r") as qss_file:
             stylesheet = qss_file.read()
             self.setStyleSheet(stylesheet)
 
+    def closeEvent(self, event):
+        # stops background scan and export before closing
+        if self.indexer is not None:
+            self.indexer.requestInterruption()
+            self.indexer.wait()
+        if self.export_worker is not None:
+            self.export_worker.requestInterruption()
+            self.export_worker.wait()
+        self.file_index.close()
+
+        # saves snapshot of the session for the next start
+        if self.use_session and self.df is not None:
+            self.save_current_session()
+        super().closeEvent(event)
+
+    def save_current_session(self):
+        x_start, x_end = self.plot_widget.plotItem.vb.viewRange()[0]
+        state = {
+            "file": self.current_file,
+            "visibility": {column: curve.isVisible() for column, curve in self.curve_list.items()},
+            "labels": {label: [item.pos().x(), item.pos().y(), item.color.name()]
+                       for label, item in self.graph_label_list.items()},
+            "x_range": [x_start, x_end],
+            "markers": None
+        }
+        if self.analyse_window is not None:
+            markers = (self.analyse_window.start_x_val, self.analyse_window.end_x_val)
+            state["markers"] = [None if x is None else float(x) for x in markers]
+
+        derived = {"tiers": self.df_tiers, "segments": self.segments, "segment_stats": self.segment_stats,
+                   "resampled": self.resampled}
+        try:
+            save_session(os.path.join(self.csv_path, self.current_file), self.CONFIG, self.df, derived, state,
+                         save_df=not self.session_saved)
+        except Exception as e:
+            print("Error while trying to save session:", e)
+
+    def restore_session(self):
+        # data is memory mapped from the snapshot; CSV file is only read again if it or config.json changed
+        # a broken snapshot (e.g. truncated file, saved with another pandas version) is deleted and the app
+        # starts without file
+        try:
+            session = load_session(self.CONFIG)
+            if session is not None:
+                self.apply_session(*session)
+        except Exception as e:
+            print("Error while trying to restore session, snapshot is deleted:", e)
+            self.reset_data()
+            delete_session()
+
+    def apply_session(self, meta, df, derived):
+        self.df = df
+        state = meta["state"]
+        self.df_tiers = derived["tiers"]
+        self.segments = derived["segments"]
+        self.segment_stats = derived["segment_stats"]
+        self.resampled = derived["resampled"]
+        self.current_file = state["file"]
+        self.session_saved = True
+
+        # selects file in dropdown without loading it again
+        self.dropdown.blockSignals(True)
+        index = self.dropdown.findText(self.current_file)
+        if index < 0:
+            self.dropdown.addItem(self.current_file)  # file index is still scanning
+            index = self.dropdown.count() - 1
+        self.dropdown.setCurrentIndex(index)
+        self.dropdown.blockSignals(False)
+
+        self.set_headline(self.current_file)
+        self.clear_plot()
+        self.show_plot()
+
+        # curves, labels and view range
+        apply_visibility(self.plot_widget, self.vb_list, self.curve_list, self.graph_label_list, state["visibility"])
+        for label, (x, y, color) in state["labels"].items():
+            if label in self.curve_list:
+                self.add_plot_label(label, color, x, y)
+                self.graph_label_list[label].setVisible(self.curve_list[label].isVisible())
+        self.plot_widget.setXRange(*state["x_range"], padding=0)
+
+        # opens analyse window with start and end
+        if state["markers"] is not None:
+            self.analyse_data()
+            self.analyse_window.set_markers(*state["markers"])
+
+    def reset_data(self):
+        # start state without file
+        self.clear_plot()
+        self.overview_widget.setVisible(False)
+        self.df = None
+        self.df_tiers = {}
+        self.segments = None
+        self.segment_stats = None
+        self.resampled = False
+        self.current_file = None
+        self.session_saved = False
+
+        self.headline2.setText("Keine Datei ausgewählt")
+        self.dropdown.blockSignals(True)
+        self.dropdown.setCurrentIndex(0)
+        self.dropdown.blockSignals(False)
+        self.select_plotted_data_btn.setVisible(False)
+        self.analyse_data_btn.setVisible(False)
+        self.export_data_btn.setVisible(False)
+
+    def start_indexer(self):
+        # restarts scan after the running one has finished
+        if self.indexer is not None:
+            self.rescan_requested = True
+            return
+
+        self.indexer = FileIndexer(self.csv_path, self.CONFIG)
+        self.indexer.files_listed.connect(self.fill_dropdown)  # type: ignore
+        self.indexer.directories_found.connect(self.watch_directories)  # type: ignore
+        self.indexer.finished.connect(self.indexer_finished)  # type: ignore
+        self.indexer.start()
+
+    def indexer_finished(self):
+        self.indexer = None
+        self.fill_dropdown()  # updates tooltips with new metadata
+        self.watch_files()
+        if self.rescan_requested:
+            self.rescan_requested = False
+            self.start_indexer()
+
+    def schedule_rescan(self, _path):
+        self.rescan_timer.start()
+
+    def watch_directories(self, directories):
+        # adds directories (also new sub directories) to file watcher
+        watched = self.file_watcher.directories()
+        new_directories = [d for d in directories if d not in watched]
+        if new_directories:
+            self.file_watcher.addPaths(new_directories)
+
+    def watch_files(self):
+        # adds every indexed file to file watcher; changes inside a file aren't reported as directory change
+        # files which were replaced (e.g. saved by an editor) are removed by the watcher and added here again
+        watched = self.file_watcher.files()
+        files = [os.path.join(self.csv_path, entry["path"]) for entry in self.file_index.entries()]
+        new_files = [f for f in files if f not in watched]
+        if new_files:
+            self.file_watcher.addPaths(new_files)
+
+    def fill_dropdown(self):
+        # fills dropdown with files from file index; keeps current file selected
+        current = self.dropdown.currentText()
+        self.dropdown.blockSignals(True)  # prevents calling choose_file()
+        self.dropdown.clear()
+        self.dropdown.addItem("Datei auswählen")
+
+        for entry in self.file_index.entries(self.search_field.text()):
+            self.dropdown.addItem(entry["path"])
+            if entry["indexed"]:
+                # shows metadata as tooltip
+                tooltip = (f"Spalten: {', '.join(entry['columns'])}\n"
+                           f"Zeilen: {entry['row_count']}")
+                if entry["x_min"] is not None:
+                    tooltip += f"\n{self.CONFIG['x_axis']['label']}: {entry['x_min']:g} bis {entry['x_max']:g}"
+                self.dropdown.setItemData(self.dropdown.count() - 1, tooltip, Qt.ToolTipRole)
+
+        # deactivates the first item in the dropdown list
+        self.model = self.dropdown.model()
+        self.item = self.model.item(0)
+        self.item.setFlags(self.item.flags() & ~Qt.ItemIsEnabled)
+
+        index = self.dropdown.findText(current)
+        self.dropdown.setCurrentIndex(max(index, 0))
+        self.dropdown.blockSignals(False)
+
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Shift:
             self.plot_widget.plotItem.getViewBox().setMouseMode(pg.ViewBox.RectMode)
@@ -186,57 +445,130 @@ class MainWindow(QMainWindow):
         app.processEvents()  # manually starts event loop to show loading_window correctly;
         # app is the Core application
 
-        # set headline 2
+        # clears old measurements
+        self.profiler.reset()
+
+        # extracts data; compressed files (.csv.gz, .csv.zst, .zip) are decompressed while reading
+        # old file stays in the plot if the new one can't be read (e.g. zip archive without CSV file)
+        file = os.path.join(self.csv_path, s)
         try:
-            year, month, day, hr, minutes = str(2000 + int(s[:2])), s[2:4], s[4:6], s[7:9], s[9:11]
-            hint = s[12:]
-            self.headline2.setText("Jahr: " + year
-                                   + ", Monat: " + month
-                                   + ", Tag: " + day
-                                   + ", Start der Messung: " + hr + ":" + minutes
-                                   + ", Bemerkung: " + hint)
-        except ValueError:
-            self.headline2.setText(s)
+            with self.profiler.stage("read_csv"), open_csv(file) as f:
+                df = pandas.read_csv(f, encoding='latin-1', sep=self.CONFIG["settings"]["seperator"])
+        except Exception as e:
+            self.loading_window.close()
+            self.read_failed(s, e)
+            return
 
-        # clears data from old plot
-        self.plot_widget.clear()
-        self.curve_list = {}
-        for vb_name in self.vb_list:
-            vb = self.vb_list[vb_name]
-            vb.clear()
+        # sets headline and clears data from old plot
+        self.set_headline(s)
+        self.clear_plot()
+        self.df = df
 
-        # extracts data
-        file = os.path.join(self.csv_path, s)
-        self.df = pandas.read_csv(file, encoding='latin-1', sep=self.CONFIG["settings"]["seperator"])
+        # new cache for spectra; windows of the old file keep the old cache, so their results can't get into it
+        self.spectral_cache = SpectralCache()
 
         # converts every column to float if possible
-        for col in self.df.columns:
-            try:
-                self.df[col] = self.df[col].astype(str).str.replace(',', '.').astype(float)
-            except ValueError:
-                print("Couldn't convert column '" + col + "' to float.")
-            except AttributeError:
-                self.df[col] = self.df[col].str.replace(',', '.').astype(float)
+        with self.profiler.stage("convert_columns"):
+            for col in self.df.columns:
+                try:
+                    self.df[col] = self.df[col].astype(str).str.replace(',', '.').astype(float)
+                except ValueError:
+                    print("Couldn't convert column '" + col + "' to float.")
+                except AttributeError:
+                    self.df[col] = self.df[col].str.replace(',', '.').astype(float)
 
         # changes hh:mm:ss to minutes
         if self.CONFIG["settings"]["column_in_hh_mm_ss"]:
-            time_col = self.CONFIG["settings"]["column_in_hh_mm_ss"]
-            for i in range(len(self.df)):
-                h, m, s = self.df.iloc[i][time_col].split(':')
-                self.df.at[i, time_col] = int(h) * 3600 + int(m) * 60 + int(s)
+            with self.profiler.stage("hh_mm_ss"):
+                time_col = self.CONFIG["settings"]["column_in_hh_mm_ss"]
+                h_m_s = self.df[time_col].str.split(':', expand=True).astype(int)
+                self.df[time_col] = h_m_s[0] * 3600 + h_m_s[1] * 60 + h_m_s[2]
 
         # calculate new data
-        self.calc_data()
+        with self.profiler.stage("calc_data"):
+            self.calc_data()
 
+        # resamples data and builds pre-aggregated tiers
+        with self.profiler.stage("resample_data"):
+            self.resample_data()
+
+        # detects segments (e.g. constant current phases) and calculates their statistics
+        with self.profiler.stage("segment_data"):
+            self.segment_data()
+
+        # plots data, draws overview and shows buttons
+        self.show_plot()
+        self.current_file = s
+        self.session_saved = False  # new data is written to the session snapshot on close
+
+        # closes loading window
+        self.loading_window.close()
+
+    def read_failed(self, s, error):
+        # selects the loaded file in dropdown again
+        self.dropdown.blockSignals(True)
+        self.dropdown.setCurrentIndex(max(self.dropdown.findText(self.current_file or ""), 0))
+        self.dropdown.blockSignals(False)
+
+        msg = QMessageBox()
+        msg.setWindowTitle("Fehler!")
+        msg.setText(f"Die Datei '{s}' konnte nicht gelesen werden:\n{error}")
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.exec_()
+
+    def set_headline(self, s):
+        # set headline 2; timestamp comes from file index if already indexed
+        timestamp, hint = parse_file_name(s)
+        entry = self.file_index.entry(s)
+        if entry is not None:
+            timestamp = entry["timestamp"]
+        if timestamp is not None:
+            self.headline2.setText("Jahr: " + str(timestamp.year)
+                                   + ", Monat: " + f"{timestamp.month:02d}"
+                                   + ", Tag: " + f"{timestamp.day:02d}"
+                                   + ", Start der Messung: " + f"{timestamp:%H:%M}"
+                                   + ", Bemerkung: " + hint)
+        else:
+            self.headline2.setText(s)
+
+    def clear_plot(self):
+        # clears data from old plot; analyse window (start, end, statistics) belongs to the old data
+        self.close_analyse_window()
+        for group in self.curve_groups:
+            group.detach()
+        self.curve_groups = []
+        self.plot_widget.clear()
+        self.overview_widget.clear()
+        self.plot_widget.enableAutoRange()  # shows whole new file; region in overview starts at full range
+        self.curve_list = {}
+        self.graph_label_list.clear()  # labels were removed with plot_widget.clear(); dict is shared with select window
+        for vb_name in self.vb_list:
+            vb = self.vb_list[vb_name]
+            vb.clear()
+
+    def show_plot(self):
         # plots data
-        self.plot_data()
+        with self.profiler.stage("plot_data"):
+            if self.CONFIG["settings"]["render_mode"] == "batched":
+                self.plot_data_batched()
+            else:
+                self.plot_data()
+
+        # draws envelope of every curve in overview
+        with self.profiler.stage("draw_overview"):
+            self.draw_overview()
 
         # sets buttons visible
         self.select_plotted_data_btn.setVisible(True)
         self.analyse_data_btn.setVisible(True)
+        self.export_data_btn.setVisible(True)
 
-        # closes loading window
-        self.loading_window.close()
+        # shows measurements in status bar and profile window
+        if self.profiler.enabled:
+            self.statusBar().showMessage(self.profiler.summary())
+            self.profile_btn.setVisible(True)
+            if self.profile_window is not None:
+                self.profile_window.update_table()
 
     def calc_data(self):
         # calcs axes
@@ -259,7 +591,8 @@ class MainWindow(QMainWindow):
                         formular_calc = formular_calc.replace(f"[{column}]", f"self.df['{column}']")
 
                     try:
-                        self.df[name] = round(eval(formular_calc), 5)  # calculates formular_calc with eval
+                        with self.profiler.stage(f"formula '{name}'", "formula"):
+                            self.df[name] = round(eval(formular_calc), 5)  # calculates formular_calc with eval
                     except Exception as e:
                         print("Error while trying to calculate formula:", e)
 
@@ -284,41 +617,101 @@ class MainWindow(QMainWindow):
 
                 if callable(function):
                     try:
-                        result = function(self.df.copy())  # calls function
-                        self.df[name] = round(result, 5)
+                        with self.profiler.stage(f"script '{script_name}'", "script"):
+                            result = function(self.df.copy())  # calls function
+                            self.df[name] = round(result, 5)
                     except Exception as e:
                         print(f"Error trying to run script '{script_name}':", e)
                 else:
                     print(f"The function '{script_name}' doesn't exist in the script file.")
 
+    def resample_data(self):
+        resample_config = self.CONFIG["settings"]["resample"]
+        x_column = self.CONFIG["x_axis"]["column"]
+        self.df_tiers = {}
+        self.resampled = False
+
+        if x_column not in self.df.columns:
+            return  # error message is printed in plot_data()
+        if not pandas.api.types.is_numeric_dtype(self.df[x_column]):
+            print("Column '" + x_column + "' for x-axis isn't numeric; data isn't resampled.")
+            return
+
+        # resamples loaded data on a fixed x grid
+        if resample_config["method"]:
+            try:
+                self.df = resample(self.df, x_column, resample_config["interval"], resample_config["method"])
+                self.resampled = True
+            except ValueError as e:
+                print("Error while trying to resample data:", e)
+
+        # pre-aggregates data for plotting and statistics
+        try:
+            self.df_tiers = build_tiers(self.df, x_column, resample_config["tiers"])
+        except (ValueError, TypeError) as e:
+            print("Error while trying to build tiers:", e)
+
+    def segment_data(self):
+        segmentation_config = self.CONFIG["settings"]["segmentation"]
+        x_column = self.CONFIG["x_axis"]["column"]
+        self.segments = None
+        self.segment_stats = None
+
+        if not segmentation_config["thresholds"] or x_column not in self.df.columns:
+            return
+        if not pandas.api.types.is_numeric_dtype(self.df[x_column]):
+            print("Column '" + x_column + "' for x-axis isn't numeric; segments aren't detected.")
+            return
+
+        # checks if every column from config.json exists in dataframe df
+        thresholds = segmentation_config["thresholds"]
+        if not all(col in self.df.columns for col in thresholds):
+            print("One ore more columns for segmentation don't exist in CSV-file.")
+            return
+
+        segment_ids = detect_segments(self.df, thresholds, segmentation_config["min_points"])
+        self.segments = segment_index(self.df, x_column, segment_ids)
+        self.segment_stats = statistics(self.df, x_column, segment_ids)
+
+    def plot_df(self):
+        # returns data to plot: min/max envelope of the tier from config.json or loaded data
+        plot_tier = self.CONFIG["settings"]["resample"]["plot_tier"]
+        if plot_tier and plot_tier in self.df_tiers:
+            tier = self.df_tiers[plot_tier]
+            return envelope_to_curve(tier["min"], tier["max"])
+        return self.df
+
     def plot_data(self):
+        plot_df = self.plot_df()
+
         # -------------- x axis --------------
         # column from config file
         x_column = self.CONFIG["x_axis"]["column"]
 
         # column from CSV file
         try:
-            x_data = self.df[x_column].tolist()
+            x_data = plot_df[x_column].tolist()
         except KeyError:
             print("Column name '" + x_column + "' for x-axis from config.json doesn't exist in CSV-file.")
             return
 
         # -------------- y axis --------------
         # columns from CSV file
-        column_list = self.df.columns.tolist()
+        column_list = plot_df.columns.tolist()
 
         for column_from_df in column_list:
             # skips x_column
             if column_from_df == x_column:
                 continue
 
-            y_data = self.df[column_from_df].tolist()
+            y_data = plot_df[column_from_df].tolist()
 
             # checks if column is in column from main_y_axis from config.json
             for main_column in self.CONFIG["main_y_axis"]["columns"]:
                 if column_from_df in main_column:
                     # plots on main y-axis
                     curve = self.plot_widget.plot(x_data, y_data, pen=pg.mkPen(color='black'))
+                    self.profiler.count("rendered_points", len(y_data))
                     self.curve_list[column_from_df] = curve
 
                     # activates clickable curve
@@ -342,6 +735,7 @@ class MainWindow(QMainWindow):
                     # creates new curve and adds curve to ViewBox; plots data on one of secondary y-axes
                     curve = pg.PlotCurveItem(x_data, y_data, pen=axis_color)
                     vb.addItem(curve)
+                    self.profiler.count("rendered_points", len(y_data))
 
                     # syncs every vb with plot widget; needs extra function so lambda gets new vb for each iteration
                     self.sync_vb_and_plotwidget(vb)
@@ -369,6 +763,7 @@ class MainWindow(QMainWindow):
                     # creates new curve and adds curve to ViewBox; plots data on one of secondary y-axes
                     curve = pg.PlotCurveItem(x_data, y_data, pen=axis_color)
                     vb.addItem(curve)
+                    self.profiler.count("rendered_points", len(y_data))
 
                     # syncs every vb with plot widget; needs extra function so lambda gets new vb for each iteration
                     self.sync_vb_and_plotwidget(vb)
@@ -382,6 +777,102 @@ class MainWindow(QMainWindow):
                         lambda _, ev, color=axis_color, col=column_from_df: self.show_plot_label(ev, color, col)
                     )
 
+    def plot_data_batched(self):
+        # draws all curves of a ViewBox with the same color as one item; faster with many curves
+        plot_df = self.plot_df()
+        x_column = self.CONFIG["x_axis"]["column"]
+        if x_column not in plot_df.columns:
+            print("Column name '" + x_column + "' for x-axis from config.json doesn't exist in CSV-file.")
+            return
+        x_data = plot_df[x_column].to_numpy(dtype=float)
+
+        groups = {}  # {(axis name, color): CurveGroup}
+        for column_from_df in plot_df.columns.tolist():
+            axis_name = curve_axis(column_from_df, self.CONFIG)
+            if column_from_df == x_column or axis_name is None:
+                continue
+
+            # gets ViewBox and color of axis
+            if axis_name == self.CONFIG["main_y_axis"]["name"]:
+                vb = self.plot_widget.plotItem.vb
+                color = "black"
+            else:
+                vb = self.vb_list[axis_name]
+                color = self.axis_list[axis_name].pen().color().name()
+
+            # creates one group (one item) per ViewBox and color
+            if (axis_name, color) not in groups:
+                group = CurveGroup(vb, x_data, color)
+                vb.addItem(group.item)
+                if vb is not self.plot_widget.plotItem.vb:
+                    self.sync_vb_and_plotwidget(vb)
+                groups[(axis_name, color)] = group
+                self.curve_groups.append(group)
+
+            y_data = plot_df[column_from_df].to_numpy(dtype=float)
+            self.curve_list[column_from_df] = groups[(axis_name, color)].add_curve(column_from_df, y_data)
+
+        # applies auto range now instead of before the next paint, so the first rebuild already clips to the
+        # x range of the new file; counts points drawn by it (visible x range only)
+        self.plot_widget.plotItem.vb.updateAutoRange()
+        for group in self.curve_groups:
+            group.rebuild()
+            self.profiler.count("rendered_points", group.rendered_points)
+
+    def pick_batched_curve(self, event):
+        # shows label of the nearest batched curve next to the click
+        if not self.curve_groups or event.button() != Qt.LeftButton:
+            return
+        best_group, best_column, best_distance = None, None, None
+        for group in self.curve_groups:
+            column, distance = group.pick(event.scenePos())
+            if column is not None and (best_distance is None or distance < best_distance):
+                best_group, best_column, best_distance = group, column, distance
+        if best_column is not None:
+            self.show_plot_label(event, best_group.color, best_column)
+
+    def curve_color(self, column):
+        # color of the axis of a curve
+        axis_name = curve_axis(column, self.CONFIG)
+        if axis_name == self.CONFIG["main_y_axis"]["name"]:
+            return "black"
+        return self.axis_list[axis_name].pen().color().name()
+
+    def draw_overview(self):
+        # envelope is calculated once per file; moving the region never reads the data again
+        x_column = self.CONFIG["x_axis"]["column"]
+        columns = [column for column, curve in self.curve_list.items() if curve.isVisible()]
+        if (x_column not in self.df.columns or not columns or len(self.df) < 2
+                or not pandas.api.types.is_numeric_dtype(self.df[x_column])):
+            self.overview_widget.setVisible(False)
+            return
+
+        x_data, y_data = overview_envelope(self.df, x_column, columns)
+        if len(x_data) == 0:
+            self.overview_widget.setVisible(False)  # no row with x value
+            return
+        for column in columns:
+            self.overview_widget.addItem(pg.PlotCurveItem(x_data, y_data[column], pen=self.curve_color(column)))
+        self.overview_widget.addItem(self.overview_region)
+        self.overview_widget.setXRange(x_data[0], x_data[-1], padding=0)
+        self.overview_widget.setYRange(0, 1, padding=0.05)
+        self.overview_widget.setVisible(True)
+        self.plot_range_changed()
+
+    def overview_region_changed(self):
+        # sets x range of plot to region; plot_range_changed() mustn't move the region back meanwhile
+        self.moving_overview_region = True
+        self.plot_widget.setXRange(*self.overview_region.getRegion(), padding=0)
+        self.moving_overview_region = False
+
+    def plot_range_changed(self, *args):
+        # moves region to x range of plot (e.g. after panning or zooming the plot)
+        if self.moving_overview_region:
+            return
+        self.overview_region.blockSignals(True)
+        self.overview_region.setRegion(self.plot_widget.plotItem.vb.viewRange()[0])
+        self.overview_region.blockSignals(False)
+
     def sync_vb_and_plotwidget(self, vb):
         # Synchronize the geometry of the ViewBox with the main plot
         self.plot_widget.plotItem.vb.sigResized.connect(
@@ -412,11 +903,14 @@ class MainWindow(QMainWindow):
                 self.graph_label_list[label].setPos(plot_pos.x(), plot_pos.y())
 
         else:
-            # creates new label and sets position; saves in list to access label from other windows
-            self.graph_label_list[label] = pg.TextItem(label, color=color, anchor=(0.5, 0.5), fill=(211, 211, 211, 240))
-            self.graph_label_list[label].setVisible(True)
-            self.plot_widget.addItem(self.graph_label_list[label])
-            self.graph_label_list[label].setPos(plot_pos.x(), plot_pos.y())
+            self.add_plot_label(label, color, plot_pos.x(), plot_pos.y())
+
+    def add_plot_label(self, label, color, x, y):
+        # creates new label and sets position; saves in list to access label from other windows
+        self.graph_label_list[label] = pg.TextItem(label, color=color, anchor=(0.5, 0.5), fill=(211, 211, 211, 240))
+        self.graph_label_list[label].setVisible(True)
+        self.plot_widget.addItem(self.graph_label_list[label])
+        self.graph_label_list[label].setPos(x, y)
 
     def select_plotted_data(self):
         if self.select_window is None:
@@ -434,11 +928,95 @@ class MainWindow(QMainWindow):
     def analyse_data(self):
         if self.analyse_window is None:
             self.analyse_window = AnalyseWindow(self.vb_list, self.axis_list,
-                                                self.plot_widget, self.curve_list, self.df, self.CONFIG)
+                                                self.plot_widget, self.curve_list, self.df, self.CONFIG,
+                                                self.df_tiers, self.segments, self.segment_stats,
+                                                self.spectral_cache, self.resampled)
             self.analyse_window.setAttribute(Qt.WA_DeleteOnClose)  # deletes windows on close
             self.analyse_window.destroyed.connect(self.reset_analyse_window)
         self.analyse_window.show()
 
+    def export_data(self):
+        if self.export_worker is not None:
+            self.statusBar().showMessage("Export läuft bereits.")
+            return
+
+        x_column = self.CONFIG["x_axis"]["column"]
+        if x_column not in self.df.columns:
+            return
+
+        # x range: start and end from analyse window if set for the loaded data, otherwise visible range of plot
+        if (self.analyse_window is not None and self.analyse_window.raw_df is self.df
+                and self.analyse_window.start_x_val is not None and self.analyse_window.end_x_val is not None):
+            x_start, x_end = self.analyse_window.start_x_val, self.analyse_window.end_x_val
+            if x_start >= x_end:
+                msg = QMessageBox()
+                msg.setWindowTitle("Fehler!")
+                msg.setText(f"Der Startwert \n"
+                            f"x = {x_start}\n"
+                            f"muss kleiner sein als der Endwert\n"
+                            f"x = {x_end}.")
+                msg.setStandardButtons(QMessageBox.Ok)
+                msg.exec_()
+                return
+        else:
+            x_start, x_end = self.plot_widget.plotItem.vb.viewRange()[0]
+
+        # columns: x column, visible curves and calculated columns
+        columns = [x_column]
+        columns += [column for column, curve in self.curve_list.items() if curve.isVisible()]
+        columns += [calc_axis["name"] for calc_axis in self.CONFIG["calc_y_axes"]
+                    if calc_axis["name"] in self.df.columns and calc_axis["name"] not in columns]
+
+        # file name and format
+        filename, file_filter = QFileDialog.getSaveFileName(self, "Exportieren", "export",
+                                                            ";;".join(EXPORT_FORMATS))
+        if not filename:
+            return
+
+        self.export_worker = ExportWorker(self.df, columns, x_column, x_start, x_end, filename,
+                                          EXPORT_FORMATS[file_filter], self.CONFIG["settings"]["seperator"])
+        self.export_worker.progress.connect(self.export_progress.setValue)  # type: ignore
+        self.export_worker.failed.connect(self.export_failed)  # type: ignore
+        self.export_worker.finished.connect(self.export_finished)  # type: ignore
+        self.export_progress.setValue(0)
+        self.export_progress.setVisible(True)
+        self.statusBar().showMessage(f"Exportiere {filename}...")
+        self.export_worker.start()
+
+    def export_failed(self, message):
+        msg = QMessageBox()
+        msg.setWindowTitle("Fehler!")
+        msg.setText(f"Export fehlgeschlagen:\n{message}")
+        msg.setStandardButtons(QMessageBox.Ok)
+        msg.exec_()
+
+    def export_finished(self):
+        # also called after an error or interruption; incomplete file was deleted by the worker then
+        if self.export_worker.completed:
+            self.statusBar().showMessage(f"Export beendet: {self.export_worker.filename}")
+        else:
+            self.statusBar().showMessage(f"Export abgebrochen: {self.export_worker.filename}")
+        self.export_progress.setVisible(False)
+        self.export_worker = None
+
+    def show_profile(self):
+        if self.profile_window is None:
+            self.profile_window = ProfileWindow(self.profiler)
+            self.profile_window.setAttribute(Qt.WA_DeleteOnClose)  # deletes windows on close
+            self.profile_window.destroyed.connect(self.reset_profile_window)
+        self.profile_window.show()
+
+    def reset_profile_window(self):
+        self.profile_window = None
+
+    def close_analyse_window(self):
+        # resets at once instead of after the window was destroyed, so a new analyse window can be opened
+        # in the same call (e.g. restore_session())
+        if self.analyse_window is not None:
+            self.analyse_window.destroyed.disconnect(self.reset_analyse_window)
+            self.analyse_window.close()
+            self.reset_analyse_window()
+
     def reset_analyse_window(self):
         self.analyse_window = None
         self.vb_list["dashed_start"].clear()
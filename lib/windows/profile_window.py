@@ -0,0 +1,94 @@
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtWidgets import (
+    QVBoxLayout,
+    QHBoxLayout,
+    QWidget,
+    QShortcut,
+    QLabel,
+    QTableWidget,
+    QTableWidgetItem,
+    QPushButton,
+    QFileDialog
+)
+
+
+class ProfileWindow(QWidget):
+    def __init__(self, profiler):
+        super().__init__()
+        # initialises instance variables
+        self.profiler = profiler
+
+        # profile window settings
+        self.setWindowTitle("Profil")
+        self.setMinimumSize(QSize(600, 500))
+
+        # set styles
+        self.load_stylesheet("lib/assets/style.qss")
+
+        # window box and layout
+        self.win_layout = QVBoxLayout()
+        self.setLayout(self.win_layout)
+
+        # Shortcut für ESC
+        self.shortcut_exit = QShortcut(QKeySequence("Esc"), self)
+        self.shortcut_exit.activated.connect(self.close)  # type: ignore
+
+        # headline
+        self.headline = QLabel("Laufzeiten")
+        self.win_layout.addWidget(self.headline)
+
+        # table with one row per stage
+        self.stage_table = QTableWidget()
+        self.stage_table.setColumnCount(3)
+        self.stage_table.setHorizontalHeaderLabels(["Schritt", "Zeit / ms", "Speicher / MB"])
+        self.stage_table.verticalHeader().setVisible(False)
+        self.win_layout.addWidget(self.stage_table)
+
+        # counters (e.g. rendered points)
+        self.counter_label = QLabel()
+        self.win_layout.addWidget(self.counter_label)
+
+        # export buttons
+        self.button_box = QWidget()
+        self.button_layout = QHBoxLayout()
+        self.button_box.setLayout(self.button_layout)
+        self.win_layout.addWidget(self.button_box)
+
+        self.export_json_btn = QPushButton("Als JSON exportieren")
+        self.export_json_btn.clicked.connect(self.export_json)  # type: ignore
+        self.button_layout.addWidget(self.export_json_btn)
+
+        self.export_trace_btn = QPushButton("Als Chrome-Trace exportieren")
+        self.export_trace_btn.clicked.connect(self.export_chrome_trace)  # type: ignore
+        self.button_layout.addWidget(self.export_trace_btn)
+
+        self.update_table()
+
+    def load_stylesheet(self, filename):
+        with open(filename, "r") as qss_file:
+            stylesheet = qss_file.read()
+            self.setStyleSheet(stylesheet)
+
+    def update_table(self):
+        records = self.profiler.finished_records()
+        self.stage_table.setRowCount(len(records))
+        for row, record in enumerate(records):
+            name = "    " * record["depth"] + record["name"]  # indents nested stages
+            self.stage_table.setItem(row, 0, QTableWidgetItem(name))
+            self.stage_table.setItem(row, 1, QTableWidgetItem(f"{record['duration'] * 1000:.1f}"))
+            self.stage_table.setItem(row, 2, QTableWidgetItem(f"{record['memory_delta'] / 1e6:.2f}"))
+        self.stage_table.resizeColumnsToContents()
+
+        counters = [f"{name}: {value}" for name, value in self.profiler.counters.items()]
+        self.counter_label.setText(", ".join(counters))
+
+    def export_json(self):
+        filename, _ = QFileDialog.getSaveFileName(self, "Profil exportieren", "profile.json", "JSON (*.json)")
+        if filename:
+            self.profiler.export_json(filename)
+
+    def export_chrome_trace(self):
+        filename, _ = QFileDialog.getSaveFileName(self, "Profil exportieren", "trace.json", "Chrome-Trace (*.json)")
+        if filename:
+            self.profiler.export_chrome_trace(filename)
@@ -1,3 +1,4 @@
+import re
 from PyQt5.QtCore import QSize, Qt
 from PyQt5.QtGui import QKeySequence, QBrush, QColor
 from PyQt5.QtWidgets import (
@@ -6,8 +7,11 @@ from PyQt5.QtWidgets import (
     QShortcut,
     QTreeWidget,
     QTreeWidgetItem,
-    QPushButton
+    QPushButton,
+    QComboBox,
+    QInputDialog
 )
+from lib.utils.visibility import apply_visibility, preset_visibility, load_presets, save_preset
 
 
 class SelectWindow(QWidget):
@@ -53,6 +57,17 @@ class SelectWindow(QWidget):
         self.un_check_all_btn.clicked.connect(self.un_select_all)  # type: ignore
         self.win_layout.addWidget(self.un_check_all_btn)
 
+        # dropdown to apply presets (from config.json and saved presets)
+        self.preset_dropdown = QComboBox()
+        self.fill_preset_dropdown()
+        self.preset_dropdown.activated.connect(self.apply_preset)  # type: ignore
+        self.win_layout.addWidget(self.preset_dropdown)
+
+        # button to save current selection as preset
+        self.save_preset_btn = QPushButton("Auswahl speichern")
+        self.save_preset_btn.clicked.connect(self.save_selection)  # type: ignore
+        self.win_layout.addWidget(self.save_preset_btn)
+
         # adds tree parents for secondary_y_axes
         for axis_name in self.axis_list:
             axis_label = axis_list[axis_name].label.toPlainText()
@@ -133,19 +148,46 @@ class SelectWindow(QWidget):
         else:
             item.setCheckState(0, Qt.Unchecked)
 
+    def set_visibility(self, visibility):
+        # shows/hides many curves at once; visibility = {column: True/False}
+        # blocks itemChanged, so select_plot() isn't called (and the plot repainted) for every item
+        self.tree.blockSignals(True)
+        for column, visible in visibility.items():
+            if column in self.item_list:
+                self.item_list[column].setCheckState(0, Qt.Checked if visible else Qt.Unchecked)
+        self.tree.blockSignals(False)
+
+        apply_visibility(self.plot_widget, self.vb_list, self.curve_list, self.graph_label_list, visibility)
+
     def un_select_all(self):
         if self.un_check_all_btn_state == "uncheck":
-            for i_parents in range(self.tree.topLevelItemCount()):
-                parent = self.tree.topLevelItem(i_parents)
-                for i_item in range(parent.childCount()):
-                    item = parent.child(i_item)
-                    item.setCheckState(0, Qt.Unchecked)
+            self.set_visibility({column: False for column in self.item_list})
             self.un_check_all_btn_state = "check"
 
         elif self.un_check_all_btn_state == "check":
-            for i_parents in range(self.tree.topLevelItemCount()):
-                parent = self.tree.topLevelItem(i_parents)
-                for i_item in range(parent.childCount()):
-                    item = parent.child(i_item)
-                    item.setCheckState(0, Qt.Checked)
+            self.set_visibility({column: True for column in self.item_list})
             self.un_check_all_btn_state = "uncheck"
+
+    def fill_preset_dropdown(self):
+        self.presets = load_presets(self.CONFIG)
+        self.preset_dropdown.clear()
+        self.preset_dropdown.addItem("Preset auswählen")
+        self.preset_dropdown.addItems([preset["name"] for preset in self.presets])
+
+    def apply_preset(self, index):
+        if index == 0:
+            return  # "Preset auswählen"
+        preset = self.presets[index - 1]
+        try:
+            self.set_visibility(preset_visibility(preset, self.curve_list, self.CONFIG))
+        except re.error as e:
+            print(f"Invalid pattern in preset '{preset['name']}':", e)
+        self.preset_dropdown.setCurrentIndex(0)
+
+    def save_selection(self):
+        name, ok = QInputDialog.getText(self, "Auswahl speichern", "Name:")
+        if not ok or not name:
+            return
+        visible_columns = [column for column, curve in self.curve_list.items() if curve.isVisible()]
+        save_preset({"name": name, "columns": visible_columns, "exclusive": True})
+        self.fill_preset_dropdown()
@@ -0,0 +1,168 @@
+import numpy
+import pyqtgraph as pg
+from PyQt5.QtCore import QSize, QRectF
+from PyQt5.QtGui import QKeySequence
+from PyQt5.QtWidgets import (
+    QVBoxLayout,
+    QHBoxLayout,
+    QWidget,
+    QShortcut,
+    QLabel,
+    QComboBox,
+    QPushButton
+)
+from lib.utils.spectral import WINDOWS, SpectrumWorker
+
+MODES = ["FFT", "Welch-PSD", "Spektrogramm"]
+SEGMENT_LENGTHS = [256, 1024, 4096, 16384, 65536]
+
+
+class SpectrumWindow(QWidget):
+    def __init__(self, df, config, x_start, x_end, cache):
+        super().__init__()
+        # initialises instance variables
+        self.df = df
+        self.CONFIG = config
+        self.x_start = x_start
+        self.x_end = x_end
+        self.cache = cache  # results of earlier calculations; see SpectralCache
+        self.worker = None
+
+        # spectrum window settings
+        self.setWindowTitle("Spektrum")
+        self.setMinimumSize(QSize(800, 600))
+
+        # set styles
+        self.load_stylesheet("lib/assets/style.qss")
+
+        # window box and layout
+        self.win_layout = QVBoxLayout()
+        self.setLayout(self.win_layout)
+
+        # Shortcut für ESC
+        self.shortcut_exit = QShortcut(QKeySequence("Esc"), self)
+        self.shortcut_exit.activated.connect(self.close)  # type: ignore
+
+        # headline with range
+        self.headline = QLabel(f"Bereich: x = {x_start:g} bis {x_end:g}")
+        self.win_layout.addWidget(self.headline)
+
+        # settings box
+        self.settings_box = QWidget()
+        self.settings_layout = QHBoxLayout()
+        self.settings_box.setLayout(self.settings_layout)
+        self.win_layout.addWidget(self.settings_box)
+
+        # dropdown for column
+        x_column = self.CONFIG["x_axis"]["column"]
+        self.column_dropdown = QComboBox()
+        self.column_dropdown.addItems([column for column in self.df.select_dtypes("number").columns
+                                       if column != x_column])
+        self.settings_layout.addWidget(self.column_dropdown)
+
+        # dropdown for mode
+        self.mode_dropdown = QComboBox()
+        self.mode_dropdown.addItems(MODES)
+        self.settings_layout.addWidget(self.mode_dropdown)
+
+        # dropdown for window function
+        self.window_dropdown = QComboBox()
+        self.window_dropdown.addItems(list(WINDOWS))
+        self.settings_layout.addWidget(self.window_dropdown)
+
+        # dropdown for segment length (Welch-PSD and Spektrogramm)
+        self.segment_dropdown = QComboBox()
+        for segment_length in SEGMENT_LENGTHS:
+            self.segment_dropdown.addItem(f"Segment: {segment_length}", segment_length)
+        self.segment_dropdown.setCurrentIndex(1)
+        self.settings_layout.addWidget(self.segment_dropdown)
+
+        # button to start calculation
+        self.calc_btn = QPushButton("Berechnen")
+        self.calc_btn.clicked.connect(self.calculate)  # type: ignore
+        self.settings_layout.addWidget(self.calc_btn)
+
+        # info about resampled data
+        self.info_label = QLabel("")
+        self.win_layout.addWidget(self.info_label)
+
+        # plot for spectrum
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
+        self.plot_widget.setBackground("lightgray")
+        self.plot_widget.getAxis('bottom').setTextPen('black')
+        self.plot_widget.getAxis('left').setTextPen('black')
+        self.win_layout.addWidget(self.plot_widget)
+
+    def load_stylesheet(self, filename):
+        with open(filename, "r") as qss_file:
+            stylesheet = qss_file.read()
+            self.setStyleSheet(stylesheet)
+
+    def closeEvent(self, event):
+        # waits for running calculation
+        if self.worker is not None:
+            self.worker.wait()
+        super().closeEvent(event)
+
+    def calculate(self):
+        if self.worker is not None or self.column_dropdown.count() == 0:
+            return  # calculation is running or nothing to calculate
+
+        column = self.column_dropdown.currentText()
+        mode = self.mode_dropdown.currentText()
+        window = self.window_dropdown.currentText()
+        segment_length = self.segment_dropdown.currentData()
+        key = (column, self.x_start, self.x_end, mode, window, segment_length if mode != "FFT" else None)
+
+        # shows result from cache without calculating again
+        result = self.cache.get(key)
+        if result is not None:
+            self.show_result(key, result)
+            return
+
+        # calculates in background
+        x_column = self.CONFIG["x_axis"]["column"]
+        self.worker = SpectrumWorker(key, self.df[x_column].to_numpy(), self.df[column].to_numpy(),
+                                     self.x_start, self.x_end, mode, window, segment_length)
+        self.worker.result_ready.connect(self.calculation_finished)  # type: ignore
+        self.worker.failed.connect(self.info_label.setText)  # type: ignore
+        self.worker.finished.connect(self.reset_worker)  # type: ignore
+        self.calc_btn.setEnabled(False)
+        self.info_label.setText("Berechne...")
+        self.worker.start()
+
+    def reset_worker(self):
+        self.worker = None
+        self.calc_btn.setEnabled(True)
+
+    def calculation_finished(self, key, result):
+        self.cache.put(key, result)
+        self.show_result(key, result)
+
+    def show_result(self, key, result):
+        column = key[0]
+        self.plot_widget.clear()
+        self.info_label.setText(f"{column}: {result['n']} Punkte, gleichmäßig abgetastet mit "
+                                f"Δx = {result['step']:g} (Median der Schrittweite)")
+
+        if result["mode"] == "Spektrogramm":
+            # time on x-axis, frequency on y-axis, log10 of PSD as color
+            self.plot_widget.setLogMode(x=False, y=False)
+            times, frequencies, psd = result["times"], result["frequencies"], result["values"]
+            image = pg.ImageItem(numpy.log10(psd + numpy.finfo(float).tiny))
+            image.setColorMap(pg.colormap.get("viridis"))
+            x_start = result["x_start"] + times[0]
+            width = times[-1] - times[0] if len(times) > 1 else result["step"]
+            image.setRect(QRectF(x_start, frequencies[0], width, frequencies[-1] - frequencies[0]))
+            self.plot_widget.addItem(image)
+            self.plot_widget.setLabel('bottom', self.CONFIG["x_axis"]["label"])
+            self.plot_widget.setLabel('left', "Frequenz / Hz")
+        else:
+            # spectrum with logarithmic y-axis; DC part (0 Hz) is skipped
+            frequencies, values = result["frequencies"][1:], result["values"][1:]
+            self.plot_widget.setLogMode(x=False, y=True)
+            self.plot_widget.plot(frequencies, values + numpy.finfo(float).tiny, pen=pg.mkPen(color='black'))
+            self.plot_widget.setLabel('bottom', "Frequenz / Hz")
+            self.plot_widget.setLabel('left', "Amplitude" if result["mode"] == "FFT" else f"PSD / ({column})²/Hz")
+        self.plot_widget.autoRange()